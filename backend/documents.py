@@ -0,0 +1,124 @@
+"""
+PDF rendering for hall tickets and door sheets.
+
+These functions run inside a process pool, so they only take and return plain
+data (dicts, bytes) and must not touch the database or the FastAPI app.
+"""
+import io
+from typing import Any, Dict, List, Tuple
+
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.units import mm
+from reportlab.pdfgen import canvas
+
+PAGE_WIDTH, PAGE_HEIGHT = A4
+MARGIN = 20 * mm
+
+
+def _new_canvas(buffer: io.BytesIO, title: str) -> canvas.Canvas:
+    pdf = canvas.Canvas(buffer, pagesize=A4, pageCompression=1)
+    pdf.setTitle(title)
+    pdf.setAuthor("AutoSeater+")
+    return pdf
+
+
+def _header(pdf: canvas.Canvas, title: str, exam: Dict[str, Any]) -> float:
+    y = PAGE_HEIGHT - MARGIN
+    pdf.setFont("Helvetica-Bold", 18)
+    pdf.drawString(MARGIN, y, title)
+    y -= 9 * mm
+    pdf.setFont("Helvetica", 11)
+    pdf.drawString(MARGIN, y, f"{exam['exam_name']} ({exam['exam_type']})")
+    y -= 6 * mm
+    pdf.drawString(MARGIN, y, f"Date: {exam['date']}    Time: {exam['time']}")
+    y -= 4 * mm
+    pdf.line(MARGIN, y, PAGE_WIDTH - MARGIN, y)
+    return y - 10 * mm
+
+
+def render_hall_ticket(exam: Dict[str, Any], ticket: Dict[str, Any]) -> bytes:
+    buffer = io.BytesIO()
+    pdf = _new_canvas(buffer, f"Hall Ticket {ticket['roll_number']}")
+    y = _header(pdf, "Hall Ticket", exam)
+
+    rows = [
+        ("Roll Number", ticket["roll_number"]),
+        ("Name", ticket.get("name") or "-"),
+        ("Department", ticket.get("department") or "-"),
+        ("Room", ticket["room_name"]),
+        ("Desk Number", str(ticket["desk_number"])),
+        ("Position", f"Row {ticket['row'] + 1}, Column {ticket['col'] + 1}, {ticket['side']}"),
+    ]
+    for label, value in rows:
+        pdf.setFont("Helvetica-Bold", 12)
+        pdf.drawString(MARGIN, y, f"{label}:")
+        pdf.setFont("Helvetica", 12)
+        pdf.drawString(MARGIN + 45 * mm, y, value)
+        y -= 8 * mm
+
+    y -= 20 * mm
+    pdf.line(PAGE_WIDTH - MARGIN - 60 * mm, y, PAGE_WIDTH - MARGIN, y)
+    pdf.setFont("Helvetica", 10)
+    pdf.drawString(PAGE_WIDTH - MARGIN - 60 * mm, y - 5 * mm, "Controller of Examinations")
+
+    pdf.showPage()
+    pdf.save()
+    return buffer.getvalue()
+
+
+def render_door_sheet(exam: Dict[str, Any], sheet: Dict[str, Any]) -> bytes:
+    buffer = io.BytesIO()
+    pdf = _new_canvas(buffer, f"Door Sheet {sheet['room_name']}")
+    y = _header(pdf, f"Room {sheet['room_name']}", exam)
+    columns = [MARGIN, MARGIN + 25 * mm, MARGIN + 45 * mm, MARGIN + 65 * mm, MARGIN + 115 * mm]
+    headings = ["Desk", "Row", "Column", "Left", "Right"]
+
+    def draw_headings(y: float) -> float:
+        pdf.setFont("Helvetica-Bold", 11)
+        for x, heading in zip(columns, headings):
+            pdf.drawString(x, y, heading)
+        pdf.setFont("Helvetica", 10)
+        return y - 7 * mm
+
+    y = draw_headings(y)
+    for desk in sheet["desks"]:
+        if y < MARGIN:
+            pdf.showPage()
+            y = draw_headings(PAGE_HEIGHT - MARGIN)
+        values = [
+            str(desk["desk_number"]),
+            str(desk["row"] + 1),
+            str(desk["col"] + 1),
+            desk.get("left_student") or "Empty",
+            desk.get("right_student") or "Empty",
+        ]
+        for x, value in zip(columns, values):
+            pdf.drawString(x, y, value)
+        y -= 6 * mm
+
+    pdf.setFont("Helvetica-Bold", 11)
+    pdf.drawString(MARGIN, max(y - 4 * mm, MARGIN / 2), f"Total students: {sheet['total_students']}")
+    pdf.showPage()
+    pdf.save()
+    return buffer.getvalue()
+
+
+def _archive_name(value: str) -> str:
+    # Roll numbers and room names may contain path separators, which would become nested folders
+    return value.replace('/', '_').replace('\\', '_')
+
+
+def render_batch(kind: str, exam: Dict[str, Any], items: List[Dict[str, Any]]) -> List[Tuple[str, bytes]]:
+    """Render a batch of documents and return (archive path, pdf bytes) pairs."""
+    if kind == "hall_ticket":
+        return [
+            (f"hall_tickets/{_archive_name(item['roll_number'])}.pdf", render_hall_ticket(exam, item))
+            for item in items
+        ]
+    if kind == "door_sheet":
+        # Room names are not unique, so the room id keeps archive entries distinct
+        return [
+            (f"door_sheets/{_archive_name(item['room_name'])}_{item['room_id']}.pdf", render_door_sheet(exam, item))
+            for item in items
+        ]
+    raise ValueError(f"Unknown document kind: {kind}")
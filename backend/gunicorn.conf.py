@@ -0,0 +1,33 @@
+"""
+Gunicorn configuration for running AutoSeater+ with multiple uvicorn workers.
+
+    gunicorn -c gunicorn.conf.py server:app
+
+Each worker opens its own MongoDB client in the FastAPI startup hook, so the
+pool settings in .env (MONGO_MAX_POOL_SIZE etc.) apply per worker.
+"""
+import multiprocessing
+import os
+
+bind = os.environ.get("BIND", "0.0.0.0:8000")
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# Let the app size its per-worker document rendering pool from the worker count
+raw_env = [f"WEB_CONCURRENCY={workers}"]
+
+# Do not preload the app: the Mongo client must be created after the fork.
+preload_app = False
+
+# Give in-flight requests time to finish before a worker is killed.
+graceful_timeout = int(os.environ.get("GRACEFUL_TIMEOUT", "30"))
+timeout = int(os.environ.get("WORKER_TIMEOUT", "120"))
+keepalive = int(os.environ.get("KEEPALIVE", "5"))
+
+# Recycle workers periodically to bound memory growth from large exports.
+max_requests = int(os.environ.get("MAX_REQUESTS", "0"))
+max_requests_jitter = int(os.environ.get("MAX_REQUESTS_JITTER", "0"))
+
+accesslog = "-"
+errorlog = "-"
+loglevel = os.environ.get("LOG_LEVEL", "info")
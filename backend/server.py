@@ -1,29 +1,100 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Depends, status
+from fastapi import FastAPI, APIRouter, HTTPException, Depends, Query, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from fastapi.responses import StreamingResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ASCENDING, DESCENDING, TEXT
+from bson.codec_options import CodecOptions
 import os
+import asyncio
+import json
 import logging
 from pathlib import Path
 from pydantic import BaseModel, Field, ConfigDict, EmailStr
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
+from collections import OrderedDict, deque
+from functools import lru_cache
+import random
+import re
+import time
 import uuid
 from datetime import datetime, timezone, timedelta
 from passlib.context import CryptContext
 import jwt
 import io
+import zipfile
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
 from enum import Enum
+from documents import render_batch
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
 # MongoDB connection
+# The client is created per process in the startup hook rather than at import
+# time, so pre-fork servers (gunicorn with uvicorn workers) never share a pool
+# that was opened in the master process.
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
-db = client[os.environ['DB_NAME']]
+MONGO_MAX_POOL_SIZE = int(os.environ.get('MONGO_MAX_POOL_SIZE', '100'))
+MONGO_MIN_POOL_SIZE = int(os.environ.get('MONGO_MIN_POOL_SIZE', '0'))
+MONGO_MAX_IDLE_TIME_MS = int(os.environ.get('MONGO_MAX_IDLE_TIME_MS', '60000'))
+MONGO_CONNECT_TIMEOUT_MS = int(os.environ.get('MONGO_CONNECT_TIMEOUT_MS', '10000'))
+MONGO_SERVER_SELECTION_TIMEOUT_MS = int(os.environ.get('MONGO_SERVER_SELECTION_TIMEOUT_MS', '10000'))
+MONGO_SOCKET_TIMEOUT_MS = int(os.environ.get('MONGO_SOCKET_TIMEOUT_MS', '0'))
+MONGO_COMPRESSORS = os.environ.get('MONGO_COMPRESSORS', '')  # e.g. "zstd,zlib"
+
+# Live updates
+# With EVENTS_CHANGE_STREAMS enabled (requires a replica set) route handlers
+# write their events to the `events` collection and every worker tails it with a
+# change stream, so clients connected to any worker see writes made through any
+# other worker. Event names and payloads are the same in both modes.
+EVENTS_CHANGE_STREAMS = os.environ.get('EVENTS_CHANGE_STREAMS', 'false').lower() in ('1', 'true', 'yes')
+EVENTS_HEARTBEAT_SECONDS = 15
+EVENTS_RETENTION_SECONDS = 3600
+EVENT_TICKET_EXPIRE_SECONDS = 60
+
+# Document rendering (hall tickets / door sheets)
+# Every web worker owns a pool, so by default the CPUs are split between them
+WEB_CONCURRENCY = int(os.environ.get('WEB_CONCURRENCY', '1'))
+DOCUMENT_WORKERS = int(os.environ.get('DOCUMENT_WORKERS', str(max(1, (os.cpu_count() or 1) // WEB_CONCURRENCY))))
+DOCUMENT_BATCH_SIZE = 50
+
+client: Optional[AsyncIOMotorClient] = None
+db = None
+
+STUDENT_SEARCH_MAX_RESULTS = 50
+STUDENT_LIST_MAX_RESULTS = 1000
+
+# Document codec
+# Timestamps are stored as native BSON dates and decoded as timezone-aware UTC
+# datetimes, so documents go straight into the pydantic models. Rows written as
+# ISO strings before scripts/migrate_datetimes.py was run still validate,
+# because pydantic parses ISO strings into datetime fields.
+DOCUMENT_CODEC_OPTIONS = CodecOptions(tz_aware=True, tzinfo=timezone.utc)
+
+def encode_document(model: BaseModel) -> Dict[str, Any]:
+    return model.model_dump()
+
+def student_document(student: "Student") -> Dict[str, Any]:
+    # name_lower backs the anchored, index-served name prefix search
+    return {**encode_document(student), "name_lower": student.name.lower()}
+
+def create_mongo_client() -> AsyncIOMotorClient:
+    options: Dict[str, Any] = {
+        "maxPoolSize": MONGO_MAX_POOL_SIZE,
+        "minPoolSize": MONGO_MIN_POOL_SIZE,
+        "maxIdleTimeMS": MONGO_MAX_IDLE_TIME_MS,
+        "connectTimeoutMS": MONGO_CONNECT_TIMEOUT_MS,
+        "serverSelectionTimeoutMS": MONGO_SERVER_SELECTION_TIMEOUT_MS,
+    }
+    if MONGO_SOCKET_TIMEOUT_MS > 0:
+        options["socketTimeoutMS"] = MONGO_SOCKET_TIMEOUT_MS
+    if MONGO_COMPRESSORS:
+        options["compressors"] = MONGO_COMPRESSORS
+    return AsyncIOMotorClient(mongo_url, **options)
 
 # Security
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -55,6 +126,11 @@ class SeatingMode(str, Enum):
     TWO_PER_DESK = "two_per_desk"  # CAT mode
     ONE_PER_DESK = "one_per_desk"  # Semester mode
 
+class RoomSelection(str, Enum):
+    MANUAL = "manual"      # use room_ids as given
+    MINIMAL = "minimal"    # fewest rooms, tightest fit
+    BALANCED = "balanced"  # fewest rooms, even fill rate across them
+
 # Models
 class User(BaseModel):
     model_config = ConfigDict(extra="ignore")
@@ -102,6 +178,19 @@ class StudentUpdate(BaseModel):
     subjects: Optional[List[str]] = None
     email: Optional[str] = None
 
+class StudentFilter(BaseModel):
+    department: Optional[str] = None
+    subject: Optional[str] = None
+
+class StudentBulkUpdate(BaseModel):
+    ids: Optional[List[str]] = None
+    filter: Optional[StudentFilter] = None
+    update: StudentUpdate
+
+class StudentBulkDelete(BaseModel):
+    ids: Optional[List[str]] = None
+    filter: Optional[StudentFilter] = None
+
 class Department(BaseModel):
     model_config = ConfigDict(extra="ignore")
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
@@ -152,6 +241,28 @@ class ExamCreate(BaseModel):
     departments: List[str]
     subjects: List[str]
 
+class ExamUpdate(BaseModel):
+    exam_name: Optional[str] = None
+    exam_type: Optional[ExamType] = None
+    date: Optional[str] = None
+    time: Optional[str] = None
+    departments: Optional[List[str]] = None
+    subjects: Optional[List[str]] = None
+
+class ExamFilter(BaseModel):
+    exam_type: Optional[ExamType] = None
+    date: Optional[str] = None
+    department: Optional[str] = None
+
+class ExamBulkUpdate(BaseModel):
+    ids: Optional[List[str]] = None
+    filter: Optional[ExamFilter] = None
+    update: ExamUpdate
+
+class ExamBulkDelete(BaseModel):
+    ids: Optional[List[str]] = None
+    filter: Optional[ExamFilter] = None
+
 class DeskAssignment(BaseModel):
     desk_number: int
     left_student: Optional[str] = None  # roll_number
@@ -171,8 +282,35 @@ class SeatingPlan(BaseModel):
 
 class SeatingGenerateRequest(BaseModel):
     exam_id: str
-    room_ids: List[str]
+    room_ids: List[str] = []
     seating_mode: SeatingMode
+    room_selection: RoomSelection = RoomSelection.MANUAL
+    seed: Optional[int] = None  # CAT (two_per_desk) only; semester seating is strictly roll-number ordered
+
+class RoomReport(BaseModel):
+    room_id: str
+    room_name: str
+    seat_capacity: int
+    students_seated: int
+    fill_rate: float
+
+class SeatingReport(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    exam_id: str
+    seating_mode: SeatingMode
+    room_selection: RoomSelection
+    seed: Optional[int] = None
+    total_eligible_students: int
+    total_students_assigned: int
+    unseated_students: List[str]
+    rooms: List[RoomReport]
+    overall_fill_rate: float
+    adjacency_violations: Dict[str, int]  # subject -> same-subject neighbour pairs
+    total_adjacency_violations: int
+    timings_ms: Dict[str, float]  # fetch, allocate, write, total
+    allocation_cache_hit: bool
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 # Helper functions
 def hash_password(password: str) -> str:
@@ -189,11 +327,19 @@ def create_access_token(data: dict) -> str:
     return encoded_jwt
 
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> User:
+    return await get_user_from_token(credentials.credentials)
+
+def create_event_ticket(user_id: str) -> str:
+    # Short-lived token that only opens the event stream; it travels in a URL
+    # (and therefore access logs), so it must not work as an API credential.
+    expire = datetime.now(timezone.utc) + timedelta(seconds=EVENT_TICKET_EXPIRE_SECONDS)
+    return jwt.encode({"sub": user_id, "purpose": "events", "exp": expire}, SECRET_KEY, algorithm=ALGORITHM)
+
+async def get_user_from_token(token: str, purpose: Optional[str] = None) -> User:
     try:
-        token = credentials.credentials
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         user_id: str = payload.get("sub")
-        if user_id is None:
+        if user_id is None or payload.get("purpose") != purpose:
             raise HTTPException(status_code=401, detail="Invalid authentication credentials")
     except jwt.PyJWTError:
         raise HTTPException(status_code=401, detail="Invalid authentication credentials")
@@ -202,10 +348,6 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
     if user_doc is None:
         raise HTTPException(status_code=401, detail="User not found")
     
-    # Convert ISO string to datetime if needed
-    if isinstance(user_doc.get('created_at'), str):
-        user_doc['created_at'] = datetime.fromisoformat(user_doc['created_at'])
-    
     return User(**user_doc)
 
 async def get_admin_user(current_user: User = Depends(get_current_user)) -> User:
@@ -213,6 +355,187 @@ async def get_admin_user(current_user: User = Depends(get_current_user)) -> User
         raise HTTPException(status_code=403, detail="Admin access required")
     return current_user
 
+# Event bus
+class EventBus:
+    """In-process fan-out of change events to connected SSE clients."""
+
+    def __init__(self, max_queue_size: int = 100):
+        self.max_queue_size = max_queue_size
+        self._subscribers: set = set()
+        self._sequence = 0
+
+    def subscribe(self) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        self._subscribers.discard(queue)
+
+    def publish(self, event_type: str, collection: str, **data: Any) -> None:
+        self._sequence += 1
+        event = {**data, "seq": self._sequence, "type": event_type, "collection": collection}
+        for queue in list(self._subscribers):
+            if queue.full():
+                # Slow client: drop its oldest event rather than block writers
+                queue.get_nowait()
+            queue.put_nowait(event)
+
+event_bus = EventBus()
+
+# Document rendering pool
+document_pool: Optional[ProcessPoolExecutor] = None
+
+def get_document_pool() -> ProcessPoolExecutor:
+    global document_pool
+    if document_pool is None:
+        # spawn: children import only documents.py, never this worker's Mongo client
+        document_pool = ProcessPoolExecutor(
+            max_workers=DOCUMENT_WORKERS,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+    return document_pool
+
+class ZipStreamBuffer(io.RawIOBase):
+    """Write-only sink that lets zipfile emit an archive chunk by chunk."""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+async def publish_event(event_type: str, collection: str, **data: Any) -> None:
+    if EVENTS_CHANGE_STREAMS:
+        # Every worker (this one included) picks it up from the change stream
+        await db.events.insert_one({
+            "type": event_type,
+            "collection": collection,
+            "data": data,
+            "created_at": datetime.now(timezone.utc)
+        })
+    else:
+        event_bus.publish(event_type, collection, **data)
+
+async def watch_change_streams():
+    pipeline = [{"$match": {"operationType": "insert"}}]
+    while True:
+        try:
+            async with db.events.watch(pipeline) as stream:
+                async for change in stream:
+                    event = change["fullDocument"]
+                    event_bus.publish(event["type"], event["collection"], **event.get("data", {}))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning("Change stream interrupted, retrying: %s", e)
+            await asyncio.sleep(5)
+
+# Bulk operation helpers
+def bulk_target_query(ids: Optional[List[str]], query: Dict[str, Any]) -> Dict[str, Any]:
+    """Combine an id list and a filter into one query, refusing to target a whole collection."""
+    if ids is None and not query:
+        raise HTTPException(status_code=400, detail="Provide ids or a non-empty filter")
+    if ids is not None:
+        query = {**query, "id": {"$in": ids}}
+    return query
+
+def bulk_results(ids: Optional[List[str]], affected: List[str], outcome: str) -> List[Dict[str, str]]:
+    if ids is None:
+        return [{"id": i, "status": outcome} for i in affected]
+    affected_set = set(affected)
+    return [{"id": i, "status": outcome if i in affected_set else "not_found"} for i in ids]
+
+async def bulk_update(collection, ids: Optional[List[str]], query: Dict[str, Any], update_data: Dict[str, Any], fields: Tuple[str, ...] = ()) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """
+    Apply one update to every target and return (response, updated documents).
+    
+    The write stamps each document it matches with a per-request bulk_op_id, so the
+    per-item results list exactly the documents this write touched; the stamp is
+    removed once they have been read back. `fields` are projected onto the returned
+    documents alongside `id`.
+    """
+    if not update_data:
+        raise HTTPException(status_code=400, detail="No fields to update")
+    op_id = str(uuid.uuid4())
+    result = await collection.update_many(bulk_target_query(ids, query), {"$set": {**update_data, "bulk_op_id": op_id}})
+    updated = await collection.find({"bulk_op_id": op_id}, {"_id": 0, "id": 1, **{f: 1 for f in fields}}).to_list(None)
+    await collection.update_many({"bulk_op_id": op_id}, {"$unset": {"bulk_op_id": ""}})
+    return {
+        "matched": result.matched_count,
+        "results": bulk_results(ids, [d["id"] for d in updated], "updated")
+    }, updated
+
+async def bulk_delete(collection, ids: Optional[List[str]], query: Dict[str, Any], fields: Tuple[str, ...] = ()) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """Delete every target and return (response, deleted documents), claiming targets the same way as bulk_update."""
+    op_id = str(uuid.uuid4())
+    await collection.update_many(bulk_target_query(ids, query), {"$set": {"bulk_op_id": op_id}})
+    claimed = await collection.find({"bulk_op_id": op_id}, {"_id": 0, "id": 1, **{f: 1 for f in fields}}).to_list(None)
+    result = await collection.delete_many({"bulk_op_id": op_id})
+    return {
+        "matched": len(claimed),
+        "deleted": result.deleted_count,
+        "results": bulk_results(ids, [d["id"] for d in claimed], "deleted")
+    }, claimed
+
+async def invalidate_student_seating(students: List[Dict[str, Any]], eligibility_changed: bool = False) -> Tuple[List[str], int]:
+    """
+    Drop the seating plans of every exam that seats one of `students`, plus, when their
+    department or subjects changed, of every exam they are now eligible for (their
+    resulting department and at least one of their resulting subjects).
+    Returns (exam ids whose plans were removed, number of plans removed).
+    """
+    roll_numbers = [s['roll_number'] for s in students]
+    clauses: List[Dict[str, Any]] = [
+        {"desk_assignments.left_student": {"$in": roll_numbers}},
+        {"desk_assignments.right_student": {"$in": roll_numbers}}
+    ]
+    if eligibility_changed:
+        profiles = {(s['department'], tuple(sorted(s['subjects']))) for s in students}
+        eligible_exam_ids = await db.exams.distinct("id", {"$or": [
+            {"departments": department, "subjects": {"$in": list(subjects)}} for department, subjects in profiles
+        ]})
+        clauses.append({"exam_id": {"$in": eligible_exam_ids}})
+    
+    exam_ids = await db.seating_plans.distinct("exam_id", {"$or": clauses})
+    if not exam_ids:
+        return [], 0
+    result = await db.seating_plans.delete_many({"exam_id": {"$in": exam_ids}})
+    await publish_event("seating.invalidated", "seating_plans", exam_ids=exam_ids)
+    return exam_ids, result.deleted_count
+
+def affects_seating(update_data: Dict[str, Any]) -> bool:
+    return "department" in update_data or "subjects" in update_data
+
+def student_filter_query(student_filter: Optional[StudentFilter]) -> Dict[str, Any]:
+    query: Dict[str, Any] = {}
+    if student_filter:
+        if student_filter.department:
+            query["department"] = student_filter.department
+        if student_filter.subject:
+            query["subjects"] = student_filter.subject
+    return query
+
+def exam_filter_query(exam_filter: Optional[ExamFilter]) -> Dict[str, Any]:
+    query: Dict[str, Any] = {}
+    if exam_filter:
+        if exam_filter.exam_type:
+            query["exam_type"] = exam_filter.exam_type.value
+        if exam_filter.date:
+            query["date"] = exam_filter.date
+        if exam_filter.department:
+            query["departments"] = exam_filter.department
+    return query
+
 # Authentication Routes
 @api_router.post("/auth/register", response_model=User)
 async def register(user_data: UserCreate):
@@ -236,9 +559,8 @@ async def register(user_data: UserCreate):
         role=user_data.role
     )
     
-    doc = user.model_dump()
+    doc = encode_document(user)
     doc['password'] = hashed_password
-    doc['created_at'] = doc['created_at'].isoformat()
     
     await db.users.insert_one(doc)
     return user
@@ -252,10 +574,6 @@ async def login(credentials: UserLogin):
     if not verify_password(credentials.password, user_doc['password']):
         raise HTTPException(status_code=401, detail="Invalid username or password")
     
-    # Convert ISO string to datetime
-    if isinstance(user_doc.get('created_at'), str):
-        user_doc['created_at'] = datetime.fromisoformat(user_doc['created_at'])
-    
     user = User(**{k: v for k, v in user_doc.items() if k != 'password'})
     
     access_token = create_access_token(data={"sub": user.id})
@@ -279,10 +597,11 @@ async def create_student(student_data: StudentCreate, current_user: User = Depen
         raise HTTPException(status_code=400, detail="Roll number already exists")
     
     student = Student(**student_data.model_dump())
-    doc = student.model_dump()
-    doc['created_at'] = doc['created_at'].isoformat()
+    doc = student_document(student)
     
     await db.students.insert_one(doc)
+    await bump_students_version()
+    await publish_event("student.created", "students", id=student.id)
     return student
 
 @api_router.post("/students/bulk", response_model=Dict[str, Any])
@@ -300,8 +619,7 @@ async def create_students_bulk(students_data: List[StudentCreate], current_user:
                 continue
             
             student = Student(**student_data.model_dump())
-            doc = student.model_dump()
-            doc['created_at'] = doc['created_at'].isoformat()
+            doc = student_document(student)
             
             await db.students.insert_one(doc)
             created += 1
@@ -309,27 +627,107 @@ async def create_students_bulk(students_data: List[StudentCreate], current_user:
             errors.append(f"Error creating student {student_data.roll_number}: {str(e)}")
             skipped += 1
     
+    if created:
+        await bump_students_version()
+        await publish_event("students.imported", "students", created=created)
+    
     return {
         "created": created,
         "skipped": skipped,
         "errors": errors
     }
 
-@api_router.get("/students", response_model=List[Student])
-async def get_students(current_user: User = Depends(get_current_user)):
-    students = await db.students.find({}, {"_id": 0}).to_list(10000)
-    for student in students:
-        if isinstance(student.get('created_at'), str):
-            student['created_at'] = datetime.fromisoformat(student['created_at'])
+@api_router.post("/students/bulk/update", response_model=Dict[str, Any])
+async def update_students_bulk(bulk_data: StudentBulkUpdate, current_user: User = Depends(get_admin_user)):
+    update_data = {k: v for k, v in bulk_data.update.model_dump().items() if v is not None}
+    if "name" in update_data:
+        update_data["name_lower"] = update_data["name"].lower()
+    result, updated = await bulk_update(
+        db.students, bulk_data.ids, student_filter_query(bulk_data.filter), update_data,
+        fields=("roll_number", "department", "subjects")
+    )
+    result["seating_plans_invalidated"] = 0
+    result["invalidated_exam_ids"] = []
+    if updated:
+        await bump_students_version()
+        if affects_seating(update_data):
+            result["invalidated_exam_ids"], result["seating_plans_invalidated"] = await invalidate_student_seating(
+                updated, eligibility_changed=True
+            )
+        await publish_event("students.bulk_updated", "students", ids=[s["id"] for s in updated])
+    return result
+
+@api_router.post("/students/bulk/delete", response_model=Dict[str, Any])
+async def delete_students_bulk(bulk_data: StudentBulkDelete, current_user: User = Depends(get_admin_user)):
+    result, deleted = await bulk_delete(
+        db.students, bulk_data.ids, student_filter_query(bulk_data.filter), fields=("roll_number",)
+    )
+    result["seating_plans_invalidated"] = 0
+    result["invalidated_exam_ids"] = []
+    if deleted:
+        await bump_students_version()
+        result["invalidated_exam_ids"], result["seating_plans_invalidated"] = await invalidate_student_seating(deleted)
+        await publish_event("students.bulk_deleted", "students", ids=[s["id"] for s in deleted])
+    return result
+
+def student_list_query(department: Optional[str]) -> Dict[str, Any]:
+    return {"department": department} if department else {}
+
+@api_router.get("/students/search", response_model=List[Student])
+async def search_students(
+    q: str = Query(..., min_length=1),
+    limit: int = Query(10, ge=1, le=STUDENT_SEARCH_MAX_RESULTS),
+    department: Optional[str] = None,
+    current_user: User = Depends(get_current_user)
+):
+    term = q.strip()
+    if not term:
+        return []
+    base_query = student_list_query(department)
+    students: List[Dict[str, Any]] = []
+    
+    async def top_up(query: Dict[str, Any], sort_field: str) -> None:
+        remaining = limit - len(students)
+        if remaining > 0:
+            query = {**base_query, **query, "id": {"$nin": [s['id'] for s in students]}}
+            students.extend(
+                await db.students.find(query, {"_id": 0}).sort(sort_field, ASCENDING).limit(remaining).to_list(remaining)
+            )
+    
+    # Anchored, case-sensitive regexes are index range scans: roll numbers first, then names via name_lower
+    await top_up({"roll_number": {"$in": [re.compile("^" + re.escape(t)) for t in {term, term.upper()}]}}, "roll_number")
+    await top_up({"name_lower": re.compile("^" + re.escape(term.lower()))}, "name_lower")
+    
+    # Whole-word matches on later name parts (surnames) come last, from the text index
+    remaining = limit - len(students)
+    if remaining > 0:
+        seen_ids = [s['id'] for s in students]
+        students += await db.students.find(
+            {**base_query, "$text": {"$search": term}, "id": {"$nin": seen_ids}},
+            {"_id": 0, "score": {"$meta": "textScore"}}
+        ).sort([("score", {"$meta": "textScore"})]).limit(remaining).to_list(remaining)
+    
     return students
 
+@api_router.get("/students/count", response_model=Dict[str, int])
+async def count_students(department: Optional[str] = None, current_user: User = Depends(get_current_user)):
+    return {"count": await db.students.count_documents(student_list_query(department))}
+
+@api_router.get("/students", response_model=List[Student])
+async def get_students(
+    department: Optional[str] = None,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=STUDENT_LIST_MAX_RESULTS),
+    current_user: User = Depends(get_current_user)
+):
+    cursor = db.students.find(student_list_query(department), {"_id": 0}).sort("roll_number", ASCENDING)
+    return await cursor.skip(skip).limit(limit).to_list(limit)
+
 @api_router.get("/students/{student_id}", response_model=Student)
 async def get_student(student_id: str, current_user: User = Depends(get_current_user)):
     student = await db.students.find_one({"id": student_id}, {"_id": 0})
     if not student:
         raise HTTPException(status_code=404, detail="Student not found")
-    if isinstance(student.get('created_at'), str):
-        student['created_at'] = datetime.fromisoformat(student['created_at'])
     return Student(**student)
 
 @api_router.put("/students/{student_id}", response_model=Student)
@@ -339,19 +737,25 @@ async def update_student(student_id: str, student_data: StudentUpdate, current_u
         raise HTTPException(status_code=404, detail="Student not found")
     
     update_data = {k: v for k, v in student_data.model_dump().items() if v is not None}
+    if "name" in update_data:
+        update_data["name_lower"] = update_data["name"].lower()
     if update_data:
         await db.students.update_one({"id": student_id}, {"$set": update_data})
         student.update(update_data)
-    
-    if isinstance(student.get('created_at'), str):
-        student['created_at'] = datetime.fromisoformat(student['created_at'])
+        await bump_students_version()
+        if affects_seating(update_data):
+            await invalidate_student_seating([student], eligibility_changed=True)
+        await publish_event("student.updated", "students", id=student_id)
     return Student(**student)
 
 @api_router.delete("/students/{student_id}")
 async def delete_student(student_id: str, current_user: User = Depends(get_admin_user)):
-    result = await db.students.delete_one({"id": student_id})
-    if result.deleted_count == 0:
+    student = await db.students.find_one_and_delete({"id": student_id}, {"_id": 0, "roll_number": 1})
+    if not student:
         raise HTTPException(status_code=404, detail="Student not found")
+    await bump_students_version()
+    await invalidate_student_seating([student])
+    await publish_event("student.deleted", "students", id=student_id)
     return {"message": "Student deleted successfully"}
 
 # Department Routes
@@ -362,18 +766,15 @@ async def create_department(dept_data: DepartmentCreate, current_user: User = De
         raise HTTPException(status_code=400, detail="Department code already exists")
     
     dept = Department(**dept_data.model_dump())
-    doc = dept.model_dump()
-    doc['created_at'] = doc['created_at'].isoformat()
+    doc = encode_document(dept)
     
     await db.departments.insert_one(doc)
+    await publish_event("department.created", "departments", id=dept.id)
     return dept
 
 @api_router.get("/departments", response_model=List[Department])
 async def get_departments(current_user: User = Depends(get_current_user)):
     depts = await db.departments.find({}, {"_id": 0}).to_list(1000)
-    for dept in depts:
-        if isinstance(dept.get('created_at'), str):
-            dept['created_at'] = datetime.fromisoformat(dept['created_at'])
     return depts
 
 @api_router.delete("/departments/{dept_id}")
@@ -381,24 +782,22 @@ async def delete_department(dept_id: str, current_user: User = Depends(get_admin
     result = await db.departments.delete_one({"id": dept_id})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Department not found")
+    await publish_event("department.deleted", "departments", id=dept_id)
     return {"message": "Department deleted successfully"}
 
 # Room Routes
 @api_router.post("/rooms", response_model=Room)
 async def create_room(room_data: RoomCreate, current_user: User = Depends(get_admin_user)):
     room = Room(**room_data.model_dump())
-    doc = room.model_dump()
-    doc['created_at'] = doc['created_at'].isoformat()
+    doc = encode_document(room)
     
     await db.rooms.insert_one(doc)
+    await publish_event("room.created", "rooms", id=room.id)
     return room
 
 @api_router.get("/rooms", response_model=List[Room])
 async def get_rooms(current_user: User = Depends(get_current_user)):
     rooms = await db.rooms.find({}, {"_id": 0}).to_list(1000)
-    for room in rooms:
-        if isinstance(room.get('created_at'), str):
-            room['created_at'] = datetime.fromisoformat(room['created_at'])
     return rooms
 
 @api_router.delete("/rooms/{room_id}")
@@ -406,24 +805,52 @@ async def delete_room(room_id: str, current_user: User = Depends(get_admin_user)
     result = await db.rooms.delete_one({"id": room_id})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Room not found")
+    await publish_event("room.deleted", "rooms", id=room_id)
     return {"message": "Room deleted successfully"}
 
 # Exam Routes
 @api_router.post("/exams", response_model=Exam)
 async def create_exam(exam_data: ExamCreate, current_user: User = Depends(get_admin_user)):
     exam = Exam(**exam_data.model_dump(), created_by=current_user.id)
-    doc = exam.model_dump()
-    doc['created_at'] = doc['created_at'].isoformat()
+    doc = encode_document(exam)
     
     await db.exams.insert_one(doc)
+    await publish_event("exam.created", "exams", id=exam.id)
     return exam
 
+@api_router.post("/exams/bulk/update", response_model=Dict[str, Any])
+async def update_exams_bulk(bulk_data: ExamBulkUpdate, current_user: User = Depends(get_admin_user)):
+    update_data = {k: v for k, v in bulk_data.update.model_dump(mode="json").items() if v is not None}
+    result, _ = await bulk_update(db.exams, bulk_data.ids, exam_filter_query(bulk_data.filter), update_data)
+    
+    # Changing who sits the exam makes its seating plans stale
+    updated_ids = [r["id"] for r in result["results"] if r["status"] == "updated"]
+    result["seating_plans_invalidated"] = 0
+    if updated_ids and ("departments" in update_data or "subjects" in update_data):
+        deleted = await db.seating_plans.delete_many({"exam_id": {"$in": updated_ids}})
+        result["seating_plans_invalidated"] = deleted.deleted_count
+    
+    if updated_ids:
+        await publish_event("exams.bulk_updated", "exams", ids=updated_ids)
+        if result["seating_plans_invalidated"]:
+            await publish_event("seating.invalidated", "seating_plans", exam_ids=updated_ids)
+    return result
+
+@api_router.post("/exams/bulk/delete", response_model=Dict[str, Any])
+async def delete_exams_bulk(bulk_data: ExamBulkDelete, current_user: User = Depends(get_admin_user)):
+    result, _ = await bulk_delete(db.exams, bulk_data.ids, exam_filter_query(bulk_data.filter))
+    deleted_ids = [r["id"] for r in result["results"] if r["status"] == "deleted"]
+    result["seating_plans_invalidated"] = 0
+    if deleted_ids:
+        plans = await db.seating_plans.delete_many({"exam_id": {"$in": deleted_ids}})
+        result["seating_plans_invalidated"] = plans.deleted_count
+        await db.seating_reports.delete_many({"exam_id": {"$in": deleted_ids}})
+        await publish_event("exams.bulk_deleted", "exams", ids=deleted_ids)
+    return result
+
 @api_router.get("/exams", response_model=List[Exam])
 async def get_exams(current_user: User = Depends(get_current_user)):
     exams = await db.exams.find({}, {"_id": 0}).to_list(1000)
-    for exam in exams:
-        if isinstance(exam.get('created_at'), str):
-            exam['created_at'] = datetime.fromisoformat(exam['created_at'])
     return exams
 
 @api_router.get("/exams/{exam_id}", response_model=Exam)
@@ -431,8 +858,6 @@ async def get_exam(exam_id: str, current_user: User = Depends(get_current_user))
     exam = await db.exams.find_one({"id": exam_id}, {"_id": 0})
     if not exam:
         raise HTTPException(status_code=404, detail="Exam not found")
-    if isinstance(exam.get('created_at'), str):
-        exam['created_at'] = datetime.fromisoformat(exam['created_at'])
     return Exam(**exam)
 
 @api_router.delete("/exams/{exam_id}")
@@ -443,16 +868,304 @@ async def delete_exam(exam_id: str, current_user: User = Depends(get_admin_user)
     result = await db.exams.delete_one({"id": exam_id})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Exam not found")
+    await db.seating_reports.delete_many({"exam_id": exam_id})
+    await publish_event("exam.deleted", "exams", id=exam_id)
     return {"message": "Exam and associated seating plans deleted successfully"}
 
+# Room Selection
+def room_seat_capacity(room: Dict[str, Any], seating_mode: SeatingMode) -> int:
+    usable_desks = min(room['desk_count'], room['rows'] * room['columns'])
+    return usable_desks * (2 if seating_mode == SeatingMode.TWO_PER_DESK else 1)
+
+def select_rooms(rooms: List[Dict[str, Any]], demand: int, seating_mode: SeatingMode, strategy: RoomSelection) -> List[Dict[str, Any]]:
+    """
+    Pick the rooms to seat `demand` students in, using the fewest rooms possible.
+    
+    MINIMAL fills the largest rooms first and then swaps the last room for the
+    smallest one that still covers what is left. BALANCED picks the run of
+    similarly sized rooms with the smallest total capacity that covers demand,
+    and sets a desk_limit per room so all rooms end up with a similar fill rate.
+    """
+    candidates = [r for r in rooms if room_seat_capacity(r, seating_mode) > 0]
+    candidates.sort(key=lambda r: (-room_seat_capacity(r, seating_mode), r['name'], r['id']))
+    
+    # Fewest rooms needed: first-fit over decreasing capacity
+    count = 0
+    covered = 0
+    for room in candidates:
+        if covered >= demand:
+            break
+        covered += room_seat_capacity(room, seating_mode)
+        count += 1
+    if covered < demand:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Not enough free room capacity: {demand} students, {covered} seats available"
+        )
+    
+    if strategy == RoomSelection.MINIMAL:
+        chosen = candidates[:count]
+        deficit = demand - sum(room_seat_capacity(r, seating_mode) for r in chosen[:-1])
+        # Best fit for the last room among the rooms not already chosen
+        fits = [r for r in candidates[count - 1:] if room_seat_capacity(r, seating_mode) >= deficit]
+        chosen[-1] = min(fits, key=lambda r: room_seat_capacity(r, seating_mode))
+        return chosen
+    
+    # BALANCED: sliding window of `count` rooms over capacity-sorted candidates
+    ascending = candidates[::-1]
+    best = None
+    for start in range(len(ascending) - count + 1):
+        window = ascending[start:start + count]
+        total = sum(room_seat_capacity(r, seating_mode) for r in window)
+        if total >= demand and (best is None or total < best[0]):
+            best = (total, window)
+    total, window = best if best else (covered, candidates[:count])
+    
+    seats_per_desk = 2 if seating_mode == SeatingMode.TWO_PER_DESK else 1
+    chosen = []
+    assigned = 0
+    for index, room in enumerate(sorted(window, key=lambda r: (-room_seat_capacity(r, seating_mode), r['name'], r['id']))):
+        capacity = room_seat_capacity(room, seating_mode)
+        if index == len(window) - 1:
+            quota = demand - assigned
+        else:
+            quota = min(capacity, -(-demand * capacity // total))
+        assigned += quota
+        if quota > 0:
+            chosen.append({**room, 'desk_limit': -(-quota // seats_per_desk)})
+    return chosen
+
+async def get_available_rooms(exam: Dict[str, Any]) -> List[Dict[str, Any]]:
+    # Rooms already holding another exam in the same date/time slot are unavailable
+    clashing_exams = await db.exams.find(
+        {"date": exam['date'], "time": exam['time'], "id": {"$ne": exam['id']}},
+        {"_id": 0, "id": 1}
+    ).to_list(None)
+    busy_room_ids = await db.seating_plans.distinct(
+        "room_id", {"exam_id": {"$in": [e['id'] for e in clashing_exams]}}
+    ) if clashing_exams else []
+    return await db.rooms.find({"id": {"$nin": busy_room_ids}}, {"_id": 0}).to_list(None)
+
+# Seating Allocation
+@lru_cache(maxsize=256)
+def desk_layout(rows: int, columns: int, desk_count: int) -> Tuple[Tuple[int, int, int], ...]:
+    """Row-major (desk_number, row, col) walk over a room, shared by all rooms of the same geometry."""
+    positions = ((row, col) for row in range(rows) for col in range(columns))
+    return tuple((index + 1, row, col) for index, (row, col) in zip(range(desk_count), positions))
+
+class AllocationCache:
+    """Small LRU of allocation results, so regenerating an unchanged session skips the allocator."""
+
+    def __init__(self, max_entries: int = 32):
+        self.max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()
+
+    def get(self, key: Tuple):
+        if key not in self._entries:
+            return None
+        self._entries.move_to_end(key)
+        return self._entries[key]
+
+    def put(self, key: Tuple, value) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+allocation_cache = AllocationCache()
+
+def allocation_cache_key(
+    exam: Dict[str, Any],
+    rooms: List[Dict[str, Any]],
+    seating_mode: SeatingMode,
+    seed: Optional[int],
+    students_version: str
+) -> Tuple:
+    geometry = tuple((r['id'], r['rows'], r['columns'], r['desk_count'], r.get('desk_limit')) for r in rooms)
+    return (
+        exam['id'], tuple(exam['departments']), tuple(exam['subjects']),
+        seating_mode.value, seed, geometry, students_version
+    )
+
+async def get_students_version() -> str:
+    doc = await db.counters.find_one({"id": "students"}, {"_id": 0, "version": 1})
+    return doc['version'] if doc else ""
+
+async def bump_students_version() -> None:
+    # A fresh token on every student write; allocation cache keys include it,
+    # so no worker can reuse an allocation computed from older student data
+    await db.counters.update_one({"id": "students"}, {"$set": {"version": str(uuid.uuid4())}}, upsert=True)
+
+def exam_subject_of(student: Dict[str, Any], exam_subjects: List[str]) -> Optional[str]:
+    """The subject a student sits this exam for: their first subject that the exam covers."""
+    for subject in student['subjects']:
+        if subject in exam_subjects:
+            return subject
+    return None
+
+def allocate_seating(
+    eligible_students: List[Dict[str, Any]],
+    rooms: List[Dict[str, Any]],
+    exam_subjects: List[str],
+    seating_mode: SeatingMode,
+    seed: Optional[int] = None
+) -> Tuple[List[Tuple[Dict[str, Any], List[DeskAssignment]]], int]:
+    """Assign students to desks, room by room. Pure function of its inputs."""
+    room_allocations = []
+    seated = 0
+    
+    if seating_mode == SeatingMode.TWO_PER_DESK:
+        # CAT mode: 2 students per desk from different subjects
+        # Group students by subject once, so each room continues where the last one stopped
+        subject_groups: Dict[str, deque] = {}
+        for student in eligible_students:
+            subject = exam_subject_of(student, exam_subjects)
+            if subject is not None:
+                subject_groups.setdefault(subject, deque()).append(student)
+        
+        # Seeded runs shuffle each subject group so pairings vary reproducibly
+        if seed is not None:
+            rng = random.Random(seed)
+            for subject, group in subject_groups.items():
+                shuffled = list(group)
+                rng.shuffle(shuffled)
+                subject_groups[subject] = deque(shuffled)
+        
+        subject_lists = list(subject_groups.values())
+        
+        for room in rooms:
+            if not any(subject_lists):
+                break
+            
+            desk_assignments = []
+            layout = desk_layout(room['rows'], room['columns'], room.get('desk_limit', room['desk_count']))
+            
+            for desk_number, row, col in layout:
+                left_student = None
+                right_student = None
+                
+                # Pair the first two subjects that still have students waiting
+                remaining = [group for group in subject_lists if group]
+                if len(remaining) >= 2:
+                    left_student = remaining[0].popleft()['roll_number']
+                    right_student = remaining[1].popleft()['roll_number']
+                elif len(remaining) == 1:
+                    left_student = remaining[0].popleft()['roll_number']
+                    if remaining[0]:
+                        right_student = remaining[0].popleft()['roll_number']
+                else:
+                    break
+                
+                desk_assignments.append(DeskAssignment(
+                    desk_number=desk_number,
+                    left_student=left_student,
+                    right_student=right_student,
+                    row=row,
+                    col=col
+                ))
+                seated += 1 if right_student is None else 2
+            
+            room_allocations.append((room, desk_assignments))
+    
+    else:  # ONE_PER_DESK (Semester mode)
+        # 1 student per desk, sequential roll order
+        for room in rooms:
+            if seated >= len(eligible_students):
+                break
+            
+            desk_assignments = []
+            layout = desk_layout(room['rows'], room['columns'], room.get('desk_limit', room['desk_count']))
+            
+            for desk_number, row, col in layout:
+                if seated >= len(eligible_students):
+                    break
+                
+                desk_assignments.append(DeskAssignment(
+                    desk_number=desk_number,
+                    left_student=eligible_students[seated]['roll_number'],
+                    right_student=None,
+                    row=row,
+                    col=col
+                ))
+                seated += 1
+            
+            room_allocations.append((room, desk_assignments))
+    
+    return room_allocations, seated
+
+def build_seating_report(
+    eligible_students: List[Dict[str, Any]],
+    room_allocations: List[Tuple[Dict[str, Any], List[DeskAssignment]]],
+    exam_subjects: List[str],
+    seating_mode: SeatingMode
+) -> Dict[str, Any]:
+    """
+    Fill rates, unseated students and adjacency violations for an allocation.
+    
+    A violation is a pair of students sitting the same subject in touching seats:
+    the two seats of one desk, a desk's right seat and the next desk's left seat
+    in the same row, or the same seat (left-left, right-right) at the desks
+    directly behind each other.
+    """
+    subject_by_roll = {s['roll_number']: exam_subject_of(s, exam_subjects) for s in eligible_students}
+    seated_rolls = set()
+    room_reports = []
+    violations: Dict[str, int] = {}
+    
+    for room, desk_assignments in room_allocations:
+        desks: Dict[Tuple[int, int], Tuple[Optional[str], Optional[str]]] = {}
+        for desk in desk_assignments:
+            desks[(desk.row, desk.col)] = (desk.left_student, desk.right_student)
+            seated_rolls.update(r for r in (desk.left_student, desk.right_student) if r)
+        
+        for (row, col), (left, right) in desks.items():
+            next_left = desks.get((row, col + 1), (None, None))[0]
+            behind_left, behind_right = desks.get((row + 1, col), (None, None))
+            for a, b in ((left, right), (right, next_left), (left, behind_left), (right, behind_right)):
+                subject = subject_by_roll.get(a)
+                if subject is not None and subject == subject_by_roll.get(b):
+                    violations[subject] = violations.get(subject, 0) + 1
+        
+        capacity = room_seat_capacity(room, seating_mode)
+        students_seated = sum(1 for seats in desks.values() for r in seats if r)
+        room_reports.append(RoomReport(
+            room_id=room['id'],
+            room_name=room['name'],
+            seat_capacity=capacity,
+            students_seated=students_seated,
+            fill_rate=round(students_seated / capacity, 4) if capacity else 0.0
+        ))
+    
+    total_capacity = sum(r.seat_capacity for r in room_reports)
+    return {
+        "total_eligible_students": len(eligible_students),
+        "total_students_assigned": len(seated_rolls),
+        "unseated_students": [s['roll_number'] for s in eligible_students if s['roll_number'] not in seated_rolls],
+        "rooms": room_reports,
+        "overall_fill_rate": round(len(seated_rolls) / total_capacity, 4) if total_capacity else 0.0,
+        "adjacency_violations": violations,
+        "total_adjacency_violations": sum(violations.values())
+    }
+
 # Seating Generation
 @api_router.post("/seating/generate")
 async def generate_seating(request: SeatingGenerateRequest, current_user: User = Depends(get_admin_user)):
+    started = time.perf_counter()
+    
     # Get exam
     exam = await db.exams.find_one({"id": request.exam_id}, {"_id": 0})
     if not exam:
         raise HTTPException(status_code=404, detail="Exam not found")
     
+    if request.seed is not None and request.seating_mode != SeatingMode.TWO_PER_DESK:
+        raise HTTPException(status_code=400, detail="seed only applies to CAT (two_per_desk) seating")
+    
+    # Read the version before the students so a concurrent write can only make the cache key stale, never wrong
+    students_version = await get_students_version()
+    
     # Get eligible students
     eligible_students = await db.students.find({
         "department": {"$in": exam['departments']},
@@ -463,109 +1176,42 @@ async def generate_seating(request: SeatingGenerateRequest, current_user: User =
         raise HTTPException(status_code=400, detail="No eligible students found")
     
     # Get rooms
-    rooms = await db.rooms.find({"id": {"$in": request.room_ids}}, {"_id": 0}).to_list(100)
+    if request.room_selection == RoomSelection.MANUAL:
+        rooms = await db.rooms.find({"id": {"$in": request.room_ids}}, {"_id": 0}).to_list(100)
+    else:
+        rooms = select_rooms(
+            await get_available_rooms(exam),
+            len(eligible_students),
+            request.seating_mode,
+            request.room_selection
+        )
     if not rooms:
         raise HTTPException(status_code=404, detail="No rooms found")
     
-    # Sort students by roll number
-    eligible_students.sort(key=lambda s: s['roll_number'])
+    # Sort students by roll number (id breaks ties so the order never depends on Mongo)
+    eligible_students.sort(key=lambda s: (s['roll_number'], s['id']))
+    
+    # Fill manually chosen rooms in the order the admin listed them
+    if request.room_selection == RoomSelection.MANUAL:
+        room_order = {room_id: index for index, room_id in enumerate(request.room_ids)}
+        rooms.sort(key=lambda r: room_order[r['id']])
+    fetched = time.perf_counter()
+    
+    cache_key = allocation_cache_key(exam, rooms, request.seating_mode, request.seed, students_version)
+    allocation = allocation_cache.get(cache_key)
+    cache_hit = allocation is not None
+    if allocation is None:
+        allocation = allocate_seating(eligible_students, rooms, exam['subjects'], request.seating_mode, request.seed)
+        allocation_cache.put(cache_key, allocation)
+    room_allocations, _ = allocation
+    allocated = time.perf_counter()
     
     # Delete existing seating plans for this exam
     await db.seating_plans.delete_many({"exam_id": request.exam_id})
     
     seating_plans = []
-    student_index = 0
     
-    for room in rooms:
-        if student_index >= len(eligible_students):
-            break
-        
-        desk_assignments = []
-        desk_number = 1
-        
-        if request.seating_mode == SeatingMode.TWO_PER_DESK:
-            # CAT mode: 2 students per desk from different subjects
-            # Group students by subject
-            subject_groups = {}
-            for student in eligible_students[student_index:]:
-                for subject in student['subjects']:
-                    if subject in exam['subjects']:
-                        if subject not in subject_groups:
-                            subject_groups[subject] = []
-                        subject_groups[subject].append(student)
-                        break
-            
-            # Create pairs from different subjects
-            subject_lists = list(subject_groups.values())
-            max_desks = room['desk_count']
-            
-            for row in range(room['rows']):
-                for col in range(room['columns']):
-                    if desk_number > max_desks:
-                        break
-                    
-                    left_student = None
-                    right_student = None
-                    
-                    # Try to assign students from different subjects
-                    if len(subject_lists) >= 2:
-                        if subject_lists[0]:
-                            left_student = subject_lists[0].pop(0)['roll_number']
-                        if subject_lists[1]:
-                            right_student = subject_lists[1].pop(0)['roll_number']
-                    elif len(subject_lists) == 1 and subject_lists[0]:
-                        if len(subject_lists[0]) >= 2:
-                            left_student = subject_lists[0].pop(0)['roll_number']
-                            right_student = subject_lists[0].pop(0)['roll_number']
-                        elif len(subject_lists[0]) == 1:
-                            left_student = subject_lists[0].pop(0)['roll_number']
-                    
-                    if left_student or right_student:
-                        desk_assignments.append(DeskAssignment(
-                            desk_number=desk_number,
-                            left_student=left_student,
-                            right_student=right_student,
-                            row=row,
-                            col=col
-                        ))
-                    
-                    desk_number += 1
-                    
-                    if not any(subject_lists):
-                        break
-                if not any(subject_lists):
-                    break
-            
-            # Count assigned students
-            student_index += sum(len(assignments) for assignments in [left_student, right_student] if assignments)
-        
-        else:  # ONE_PER_DESK (Semester mode)
-            # 1 student per desk, sequential roll order
-            # Vertical pairing: desk 1 with 25, 2 with 26, etc.
-            students_for_room = eligible_students[student_index:student_index + room['desk_count']]
-            
-            # Calculate vertical pairing
-            half_desks = room['desk_count'] // 2
-            
-            for row in range(room['rows']):
-                for col in range(room['columns']):
-                    if desk_number > room['desk_count'] or student_index >= len(eligible_students):
-                        break
-                    
-                    student = eligible_students[student_index] if student_index < len(eligible_students) else None
-                    
-                    if student:
-                        desk_assignments.append(DeskAssignment(
-                            desk_number=desk_number,
-                            left_student=student['roll_number'],
-                            right_student=None,
-                            row=row,
-                            col=col
-                        ))
-                        student_index += 1
-                    
-                    desk_number += 1
-        
+    for room, desk_assignments in room_allocations:
         # Create seating plan
         total_students = sum(1 for d in desk_assignments if d.left_student) + sum(1 for d in desk_assignments if d.right_student)
         
@@ -577,25 +1223,55 @@ async def generate_seating(request: SeatingGenerateRequest, current_user: User =
             total_students=total_students
         )
         
-        doc = seating_plan.model_dump()
-        doc['created_at'] = doc['created_at'].isoformat()
-        
-        await db.seating_plans.insert_one(doc)
         seating_plans.append(seating_plan)
     
+    if seating_plans:
+        await db.seating_plans.insert_many([encode_document(plan) for plan in seating_plans])
+    written = time.perf_counter()
+    
+    report = SeatingReport(
+        exam_id=request.exam_id,
+        seating_mode=request.seating_mode,
+        room_selection=request.room_selection,
+        seed=request.seed,
+        timings_ms={
+            "fetch": round((fetched - started) * 1000, 2),
+            "allocate": round((allocated - fetched) * 1000, 2),
+            "write": round((written - allocated) * 1000, 2),
+            "total": round((written - started) * 1000, 2)
+        },
+        allocation_cache_hit=cache_hit,
+        **build_seating_report(eligible_students, room_allocations, exam['subjects'], request.seating_mode)
+    )
+    await db.seating_reports.insert_one(encode_document(report))
+    if report.unseated_students:
+        logger.warning(
+            "Seating for exam %s left %d of %d students unseated",
+            request.exam_id, len(report.unseated_students), report.total_eligible_students
+        )
+    
+    await publish_event("seating.regenerated", "seating_plans", exam_id=request.exam_id, plans_created=len(seating_plans))
+    
     return {
         "message": "Seating plans generated successfully",
         "plans_created": len(seating_plans),
-        "total_students_assigned": student_index,
-        "total_eligible_students": len(eligible_students)
+        "total_students_assigned": report.total_students_assigned,
+        "total_eligible_students": report.total_eligible_students,
+        "report": report
     }
 
+@api_router.get("/seating/reports/{exam_id}", response_model=SeatingReport)
+async def get_seating_report(exam_id: str, current_user: User = Depends(get_current_user)):
+    if not await db.exams.find_one({"id": exam_id}, {"_id": 1}):
+        raise HTTPException(status_code=404, detail="Exam not found")
+    report = await db.seating_reports.find_one({"exam_id": exam_id}, {"_id": 0}, sort=[("created_at", DESCENDING)])
+    if not report:
+        raise HTTPException(status_code=404, detail="No seating report found")
+    return SeatingReport(**report)
+
 @api_router.get("/seating/exam/{exam_id}")
 async def get_seating_plans(exam_id: str, current_user: User = Depends(get_current_user)):
     plans = await db.seating_plans.find({"exam_id": exam_id}, {"_id": 0}).to_list(100)
-    for plan in plans:
-        if isinstance(plan.get('created_at'), str):
-            plan['created_at'] = datetime.fromisoformat(plan['created_at'])
     
     # Get room details
     for plan in plans:
@@ -648,6 +1324,129 @@ async def export_seating_excel(exam_id: str, current_user: User = Depends(get_cu
         headers={"Content-Disposition": f"attachment; filename=seating_plan_{exam['exam_name']}.xlsx"}
     )
 
+@api_router.get("/seating/documents/{exam_id}")
+async def export_seating_documents(
+    exam_id: str,
+    hall_tickets: bool = True,
+    door_sheets: bool = True,
+    current_user: User = Depends(get_current_user)
+):
+    exam = await db.exams.find_one({"id": exam_id}, {"_id": 0, "exam_name": 1, "exam_type": 1, "date": 1, "time": 1})
+    if not exam:
+        raise HTTPException(status_code=404, detail="Exam not found")
+    
+    plans = await db.seating_plans.find({"exam_id": exam_id}, {"_id": 0}).to_list(None)
+    if not plans:
+        raise HTTPException(status_code=404, detail="No seating plans found")
+    
+    rooms = await db.rooms.find({"id": {"$in": [p['room_id'] for p in plans]}}, {"_id": 0, "id": 1, "name": 1}).to_list(None)
+    room_names = {r['id']: r['name'] for r in rooms}
+    
+    tickets = []
+    sheets = []
+    for plan in plans:
+        room_name = room_names.get(plan['room_id'], plan['room_id'])
+        sheets.append({
+            "room_id": plan['room_id'],
+            "room_name": room_name,
+            "desks": plan['desk_assignments'],
+            "total_students": plan['total_students']
+        })
+        for desk in plan['desk_assignments']:
+            for side, key in (("Left", "left_student"), ("Right", "right_student")):
+                if desk.get(key):
+                    tickets.append({
+                        "roll_number": desk[key],
+                        "room_name": room_name,
+                        "desk_number": desk['desk_number'],
+                        "row": desk['row'],
+                        "col": desk['col'],
+                        "side": side
+                    })
+    
+    if hall_tickets and tickets:
+        students = await db.students.find(
+            {"roll_number": {"$in": [t['roll_number'] for t in tickets]}},
+            {"_id": 0, "roll_number": 1, "name": 1, "department": 1}
+        ).to_list(None)
+        by_roll = {s['roll_number']: s for s in students}
+        for ticket in tickets:
+            student = by_roll.get(ticket['roll_number'], {})
+            ticket['name'] = student.get('name')
+            ticket['department'] = student.get('department')
+    
+    batches = []
+    if door_sheets:
+        batches += [("door_sheet", sheets[i:i + DOCUMENT_BATCH_SIZE]) for i in range(0, len(sheets), DOCUMENT_BATCH_SIZE)]
+    if hall_tickets:
+        batches += [("hall_ticket", tickets[i:i + DOCUMENT_BATCH_SIZE]) for i in range(0, len(tickets), DOCUMENT_BATCH_SIZE)]
+    if not batches:
+        raise HTTPException(status_code=400, detail="No documents selected")
+    
+    async def zip_generator():
+        loop = asyncio.get_running_loop()
+        pool = get_document_pool()
+        buffer = ZipStreamBuffer()
+        # Keep at most two batches per process in flight so memory stays bounded
+        max_in_flight = DOCUMENT_WORKERS * 2
+        pending = set()
+        remaining = iter(batches)
+        with zipfile.ZipFile(buffer, mode="w", compression=zipfile.ZIP_STORED) as archive:
+            while True:
+                while len(pending) < max_in_flight:
+                    batch = next(remaining, None)
+                    if batch is None:
+                        break
+                    pending.add(loop.run_in_executor(pool, render_batch, batch[0], exam, batch[1]))
+                if not pending:
+                    break
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    for name, pdf_bytes in future.result():
+                        archive.writestr(name, pdf_bytes)
+                yield buffer.drain()
+        yield buffer.drain()
+    
+    return StreamingResponse(
+        zip_generator(),
+        media_type='application/zip',
+        headers={"Content-Disposition": f"attachment; filename=seating_documents_{exam['exam_name']}.zip"}
+    )
+
+# Metrics
+@api_router.get("/metrics/seating")
+async def get_seating_metrics(
+    limit: int = Query(100, ge=1, le=1000),
+    current_user: User = Depends(get_admin_user)
+):
+    # Aggregate the most recent generation runs so capacity and timing regressions stand out
+    pipeline = [
+        {"$sort": {"created_at": -1}},
+        {"$limit": limit},
+        {"$group": {
+            "_id": "$seating_mode",
+            "runs": {"$sum": 1},
+            "students_assigned": {"$sum": "$total_students_assigned"},
+            "students_unseated": {"$sum": {"$size": "$unseated_students"}},
+            "avg_fill_rate": {"$avg": "$overall_fill_rate"},
+            "min_fill_rate": {"$min": "$overall_fill_rate"},
+            "adjacency_violations": {"$sum": "$total_adjacency_violations"},
+            "cache_hits": {"$sum": {"$cond": ["$allocation_cache_hit", 1, 0]}},
+            "avg_fetch_ms": {"$avg": "$timings_ms.fetch"},
+            "avg_allocate_ms": {"$avg": "$timings_ms.allocate"},
+            "avg_write_ms": {"$avg": "$timings_ms.write"},
+            "avg_total_ms": {"$avg": "$timings_ms.total"},
+            "max_total_ms": {"$max": "$timings_ms.total"},
+            "last_run_at": {"$max": "$created_at"}
+        }},
+        {"$sort": {"_id": 1}}
+    ]
+    groups = await db.seating_reports.aggregate(pipeline).to_list(None)
+    return {
+        "window": limit,
+        "by_seating_mode": [{"seating_mode": g.pop("_id"), **g} for g in groups]
+    }
+
 # Dashboard Stats
 @api_router.get("/dashboard/stats")
 async def get_dashboard_stats(current_user: User = Depends(get_current_user)):
@@ -667,6 +1466,39 @@ async def get_dashboard_stats(current_user: User = Depends(get_current_user)):
         "recent_exams": recent_exams
     }
 
+# Live Events
+@api_router.post("/events/ticket")
+async def create_events_ticket(current_user: User = Depends(get_current_user)):
+    return {"ticket": create_event_ticket(current_user.id), "expires_in": EVENT_TICKET_EXPIRE_SECONDS}
+
+@api_router.get("/events/stream")
+async def stream_events(http_request: Request, ticket: str = Query(...)):
+    # EventSource cannot send an Authorization header, so a short-lived stream
+    # ticket from /events/ticket comes in the query string instead of the JWT
+    await get_user_from_token(ticket, purpose="events")
+    queue = event_bus.subscribe()
+    
+    async def event_generator():
+        try:
+            yield "retry: 5000\n\n"
+            while True:
+                if await http_request.is_disconnected():
+                    break
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=EVENTS_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": heartbeat\n\n"
+                    continue
+                yield f"id: {event['seq']}\ndata: {json.dumps(event)}\n\n"
+        finally:
+            event_bus.unsubscribe(queue)
+    
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 # Include router
 app.include_router(api_router)
 
@@ -684,6 +1516,57 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+async def ensure_indexes():
+    await db.students.create_index([("roll_number", ASCENDING)], name="roll_number")
+    await db.students.create_index([("name_lower", ASCENDING)], name="name_lower")
+    await db.students.create_index([("name", TEXT)], name="name_text")
+    await db.students.create_index([("id", ASCENDING)], name="id")
+    await db.counters.create_index([("id", ASCENDING)], name="id", unique=True)
+    await db.exams.create_index([("created_at", DESCENDING)], name="created_at")
+    for collection in (db.students, db.exams):
+        await collection.create_index([("bulk_op_id", ASCENDING)], name="bulk_op_id", sparse=True)
+    await db.seating_plans.create_index([("exam_id", ASCENDING)], name="exam_id")
+    await db.seating_plans.create_index([("desk_assignments.left_student", ASCENDING)], name="left_student")
+    await db.seating_plans.create_index([("desk_assignments.right_student", ASCENDING)], name="right_student")
+    if EVENTS_CHANGE_STREAMS:
+        await db.events.create_index([("created_at", ASCENDING)], name="ttl", expireAfterSeconds=EVENTS_RETENTION_SECONDS)
+    await db.seating_reports.create_index([("exam_id", ASCENDING), ("created_at", DESCENDING)], name="exam_id_created_at")
+    await db.seating_reports.create_index([("created_at", DESCENDING)], name="created_at")
+
+async def backfill_student_name_lower():
+    # Students written before name_lower existed; a no-op once every document has it
+    result = await db.students.update_many(
+        {"name_lower": {"$exists": False}},
+        [{"$set": {"name_lower": {"$toLower": "$name"}}}]
+    )
+    if result.modified_count:
+        logger.info("Backfilled name_lower on %s students", result.modified_count)
+
+@app.on_event("startup")
+async def startup_db_client():
+    global client, db
+    client = create_mongo_client()
+    db = client.get_database(os.environ['DB_NAME'], codec_options=DOCUMENT_CODEC_OPTIONS)
+    await ensure_indexes()
+    await backfill_student_name_lower()
+    logger.info("MongoDB client ready (pid=%s, maxPoolSize=%s)", os.getpid(), MONGO_MAX_POOL_SIZE)
+    if EVENTS_CHANGE_STREAMS:
+        app.state.change_stream_task = asyncio.create_task(watch_change_streams())
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
-    client.close()
\ No newline at end of file
+    global client, db
+    global document_pool
+    change_stream_task = getattr(app.state, "change_stream_task", None)
+    if change_stream_task is not None:
+        change_stream_task.cancel()
+    if document_pool is not None:
+        document_pool.shutdown(wait=False, cancel_futures=True)
+        document_pool = None
+    # In-flight requests have already been drained by the server at this point;
+    # closing the client releases every pooled connection for this worker.
+    if client is not None:
+        client.close()
+        logger.info("MongoDB client closed (pid=%s)", os.getpid())
+    client = None
+    db = None
\ No newline at end of file
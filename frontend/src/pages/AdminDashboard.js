@@ -3,7 +3,7 @@ import { useNavigate } from 'react-router-dom';
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from '../components/ui/card';
 import { Button } from '../components/ui/button';
 import { toast } from 'sonner';
-import { getDashboardStats, getExams } from '../utils/api';
+import { getDashboardStats, getExams, subscribeEvents } from '../utils/api';
 import Layout from '../components/Layout';
 import { 
   Users, 
@@ -28,6 +28,19 @@ const AdminDashboard = () => {
 
   useEffect(() => {
     fetchData();
+    // Coalesce bursts of events (e.g. bulk imports) into a single refresh
+    let timer = null;
+    const unsubscribe = subscribeEvents((event) => {
+      if (event.collection === 'seating_plans') {
+        return;
+      }
+      clearTimeout(timer);
+      timer = setTimeout(fetchData, 500);
+    });
+    return () => {
+      clearTimeout(timer);
+      unsubscribe();
+    };
   }, []);
 
   const fetchData = async () => {
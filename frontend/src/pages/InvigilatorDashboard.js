@@ -5,7 +5,7 @@ import { Card, CardContent, CardDescription, CardHeader, CardTitle } from '../co
 import { Button } from '../components/ui/button';
 import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from '../components/ui/select';
 import { toast } from 'sonner';
-import { getExams, getSeatingPlans } from '../utils/api';
+import { getExams, getSeatingPlans, subscribeEvents } from '../utils/api';
 import { Calendar, Eye, FileText } from 'lucide-react';
 
 const InvigilatorDashboard = () => {
@@ -15,6 +15,17 @@ const InvigilatorDashboard = () => {
 
   useEffect(() => {
     fetchExams();
+    let timer = null;
+    const unsubscribe = subscribeEvents((event) => {
+      if (event.collection === 'exams') {
+        clearTimeout(timer);
+        timer = setTimeout(fetchExams, 300);
+      }
+    });
+    return () => {
+      clearTimeout(timer);
+      unsubscribe();
+    };
   }, []);
 
   const fetchExams = async () => {
@@ -19,6 +19,8 @@ const SeatingGeneration = () => {
   const [selectedExam, setSelectedExam] = useState('');
   const [selectedRooms, setSelectedRooms] = useState([]);
   const [seatingMode, setSeatingMode] = useState('two_per_desk');
+  const [roomSelection, setRoomSelection] = useState('manual');
+  const autoSelectRooms = roomSelection !== 'manual';
   const user = typeof window !== 'undefined' && localStorage.getItem('user') ? JSON.parse(localStorage.getItem('user')) : null;
   const isAdmin = user?.role === 'admin';
 
@@ -54,7 +56,7 @@ const SeatingGeneration = () => {
       toast.error('Please select an exam');
       return;
     }
-    if (selectedRooms.length === 0) {
+    if (!autoSelectRooms && selectedRooms.length === 0) {
       toast.error('Please select at least one room');
       return;
     }
@@ -63,13 +65,18 @@ const SeatingGeneration = () => {
     try {
       const response = await generateSeating({
         exam_id: selectedExam,
-        room_ids: selectedRooms,
-        seating_mode: seatingMode
+        room_ids: autoSelectRooms ? [] : selectedRooms,
+        seating_mode: seatingMode,
+        room_selection: roomSelection
       });
 
       toast.success(
         `Seating generated! ${response.data.total_students_assigned}/${response.data.total_eligible_students} students assigned to ${response.data.plans_created} room(s)`
       );
+      const unseated = response.data.report?.unseated_students?.length || 0;
+      if (unseated > 0) {
+        toast.warning(`${unseated} student(s) could not be seated - add rooms or switch to automatic room selection`);
+      }
       
       // Navigate to preview
       setTimeout(() => {
@@ -200,10 +207,27 @@ const SeatingGeneration = () => {
                   <span className="w-8 h-8 bg-indigo-600 text-white rounded-full flex items-center justify-center text-sm font-bold">3</span>
                   Select Rooms
                 </CardTitle>
-                <CardDescription>Choose one or more rooms for the exam</CardDescription>
+                <CardDescription>Choose one or more rooms for the exam, or let the planner pick them</CardDescription>
               </CardHeader>
-              <CardContent>
-                {rooms.length === 0 ? (
+              <CardContent className="space-y-4">
+                <Select value={roomSelection} onValueChange={setRoomSelection}>
+                  <SelectTrigger data-testid="room-selection-select">
+                    <SelectValue />
+                  </SelectTrigger>
+                  <SelectContent>
+                    <SelectItem value="manual">Choose rooms manually</SelectItem>
+                    <SelectItem value="minimal">Automatic: fewest rooms, tightest fit</SelectItem>
+                    <SelectItem value="balanced">Automatic: fewest rooms, evenly filled</SelectItem>
+                  </SelectContent>
+                </Select>
+                {autoSelectRooms ? (
+                  <Alert>
+                    <AlertCircle className="w-4 h-4" />
+                    <AlertDescription>
+                      Rooms will be picked from those free in this exam's time slot, based on desk layout and the number of eligible students.
+                    </AlertDescription>
+                  </Alert>
+                ) : rooms.length === 0 ? (
                   <Alert>
                     <AlertCircle className="w-4 h-4" />
                     <AlertDescription>
@@ -269,15 +293,15 @@ const SeatingGeneration = () => {
                   </div>
                   <div className="flex items-center justify-between py-2 border-b border-gray-100">
                     <span className="text-sm text-gray-600">Rooms Selected</span>
-                    <span className="text-sm font-semibold text-gray-900">{selectedRooms.length}</span>
+                    <span className="text-sm font-semibold text-gray-900">{autoSelectRooms ? 'Auto' : selectedRooms.length}</span>
                   </div>
                   <div className="flex items-center justify-between py-2 border-b border-gray-100">
                     <span className="text-sm text-gray-600">Total Capacity</span>
-                    <span className="text-sm font-semibold text-gray-900">{totalCapacity}</span>
+                    <span className="text-sm font-semibold text-gray-900">{autoSelectRooms ? 'Auto' : totalCapacity}</span>
                   </div>
                 </div>
 
-                {selectedExam && selectedRooms.length > 0 && (
+                {selectedExam && (autoSelectRooms || selectedRooms.length > 0) && (
                   <Alert className="bg-green-50 border-green-200">
                     <CheckCircle2 className="w-4 h-4 text-green-600" />
                     <AlertDescription className="text-green-700">
@@ -291,7 +315,7 @@ const SeatingGeneration = () => {
                     className="w-full h-11 text-base font-semibold"
                     data-testid="generate-seating-button"
                     onClick={handleGenerate}
-                    disabled={!isAdmin || !selectedExam || selectedRooms.length === 0 || generating}
+                    disabled={!isAdmin || !selectedExam || (!autoSelectRooms && selectedRooms.length === 0) || generating}
                   >
                   {generating ? (
                     <>
@@ -4,7 +4,7 @@ import Layout from '../components/Layout';
 import { Button } from '../components/ui/button';
 import { Card, CardContent, CardHeader, CardTitle } from '../components/ui/card';
 import { toast } from 'sonner';
-import { getSeatingPlans, getExam, exportSeatingExcel } from '../utils/api';
+import { getSeatingPlans, getExam, exportSeatingExcel, exportSeatingDocuments, subscribeEvents } from '../utils/api';
 import { Download, Printer, FileText } from 'lucide-react';
 
 const SeatingPreview = () => {
@@ -17,6 +17,23 @@ const SeatingPreview = () => {
     fetchData();
   }, [examId]);
 
+  useEffect(() => {
+    // Coalesce bursts of events for this exam into a single refresh
+    let timer = null;
+    const unsubscribe = subscribeEvents((event) => {
+      const examIds = event.exam_ids || event.ids || [event.exam_id || event.id];
+      const relevant = (event.collection === 'seating_plans' || event.collection === 'exams') && examIds.includes(examId);
+      if (relevant) {
+        clearTimeout(timer);
+        timer = setTimeout(fetchData, 300);
+      }
+    });
+    return () => {
+      clearTimeout(timer);
+      unsubscribe();
+    };
+  }, [examId]);
+
   const fetchData = async () => {
     try {
       const [examRes, plansRes] = await Promise.all([
@@ -48,6 +65,22 @@ const SeatingPreview = () => {
     }
   };
 
+  const handleExportDocuments = async () => {
+    try {
+      const response = await exportSeatingDocuments(examId);
+      const url = window.URL.createObjectURL(new Blob([response.data]));
+      const link = document.createElement('a');
+      link.href = url;
+      link.setAttribute('download', `seating_documents_${exam?.exam_name || 'exam'}.zip`);
+      document.body.appendChild(link);
+      link.click();
+      link.remove();
+      toast.success('Hall tickets and door sheets downloaded successfully!');
+    } catch (error) {
+      console.error('Error exporting documents:', error);
+    }
+  };
+
   const handlePrint = () => {
     window.print();
   };
@@ -99,6 +132,9 @@ const SeatingPreview = () => {
             <Button variant="outline" onClick={handlePrint} data-testid="print-seating-button">
               <Printer className="w-4 h-4 mr-2" /> Print
             </Button>
+            <Button variant="outline" onClick={handleExportDocuments} data-testid="export-documents-button">
+              <FileText className="w-4 h-4 mr-2" /> Hall Tickets & Door Sheets
+            </Button>
             <Button onClick={handleExportExcel} data-testid="export-excel-button">
               <Download className="w-4 h-4 mr-2" /> Export Excel
             </Button>
@@ -6,15 +6,22 @@ import { Label } from '../components/ui/label';
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from '../components/ui/card';
 import { Dialog, DialogContent, DialogDescription, DialogHeader, DialogTitle, DialogTrigger } from '../components/ui/dialog';
 import { toast } from 'sonner';
-import { getStudents, createStudent, deleteStudent, getDepartments } from '../utils/api';
-import { Plus, Trash2, Search, Users, Upload } from 'lucide-react';
+import { getStudents, countStudents, searchStudents, createStudent, deleteStudent, getDepartments } from '../utils/api';
+import { Plus, Trash2, Search, Users, Upload, ChevronLeft, ChevronRight } from 'lucide-react';
 import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from '../components/ui/select';
 
+const PAGE_SIZE = 50;
+const ALL_DEPARTMENTS = 'all';
+
 const StudentManagement = () => {
   const [students, setStudents] = useState([]);
+  const [totalStudents, setTotalStudents] = useState(0);
+  const [page, setPage] = useState(0);
+  const [departmentFilter, setDepartmentFilter] = useState(ALL_DEPARTMENTS);
   const [departments, setDepartments] = useState([]);
   const [loading, setLoading] = useState(true);
   const [searchTerm, setSearchTerm] = useState('');
+  const [searchResults, setSearchResults] = useState([]);
   const [dialogOpen, setDialogOpen] = useState(false);
   const user = typeof window !== 'undefined' && localStorage.getItem('user') ? JSON.parse(localStorage.getItem('user')) : null;
   const isAdmin = user?.role === 'admin';
@@ -26,18 +33,52 @@ const StudentManagement = () => {
     email: ''
   });
 
+  const department = departmentFilter === ALL_DEPARTMENTS ? undefined : departmentFilter;
+
   useEffect(() => {
-    fetchData();
+    getDepartments()
+      .then((response) => setDepartments(response.data))
+      .catch((error) => console.error('Error fetching departments:', error));
   }, []);
 
-  const fetchData = async () => {
+  useEffect(() => {
+    fetchStudents();
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [page, departmentFilter]);
+
+  // Server-side typeahead: debounce keystrokes and ignore responses for stale terms
+  useEffect(() => {
+    const term = searchTerm.trim();
+    if (!term) {
+      setSearchResults([]);
+      return;
+    }
+    let cancelled = false;
+    const timer = setTimeout(async () => {
+      try {
+        const response = await searchStudents(term, 20, department);
+        if (!cancelled) {
+          setSearchResults(response.data);
+        }
+      } catch (error) {
+        console.error('Error searching students:', error);
+      }
+    }, 250);
+    return () => {
+      cancelled = true;
+      clearTimeout(timer);
+    };
+  }, [searchTerm, department]);
+
+  // One page at a time; the total comes from a server-side count
+  const fetchStudents = async () => {
     try {
-      const [studentsRes, deptsRes] = await Promise.all([
-        getStudents(),
-        getDepartments()
+      const [studentsRes, countRes] = await Promise.all([
+        getStudents({ department, skip: page * PAGE_SIZE, limit: PAGE_SIZE }),
+        countStudents({ department })
       ]);
       setStudents(studentsRes.data);
-      setDepartments(deptsRes.data);
+      setTotalStudents(countRes.data.count);
     } catch (error) {
       console.error('Error fetching data:', error);
     } finally {
@@ -64,7 +105,7 @@ const StudentManagement = () => {
         subjects: '',
         email: ''
       });
-      fetchData();
+      fetchStudents();
     } catch (error) {
       console.error('Error creating student:', error);
     }
@@ -75,18 +116,21 @@ const StudentManagement = () => {
       try {
         await deleteStudent(id);
         toast.success('Student deleted successfully!');
-        fetchData();
+        setSearchResults(prev => prev.filter(s => s.id !== id));
+        fetchStudents();
       } catch (error) {
         console.error('Error deleting student:', error);
       }
     }
   };
 
-  const filteredStudents = students.filter(student => 
-    student.name.toLowerCase().includes(searchTerm.toLowerCase()) ||
-    student.roll_number.toLowerCase().includes(searchTerm.toLowerCase()) ||
-    student.department.toLowerCase().includes(searchTerm.toLowerCase())
-  );
+  const filteredStudents = searchTerm.trim() ? searchResults : students;
+  const pageCount = Math.max(1, Math.ceil(totalStudents / PAGE_SIZE));
+
+  const handleDepartmentFilter = (value) => {
+    setDepartmentFilter(value);
+    setPage(0);
+  };
 
   if (loading) {
     return (
@@ -202,7 +246,7 @@ const StudentManagement = () => {
               <div className="flex items-center justify-between">
                 <div>
                   <p className="text-sm font-medium text-gray-500">Total Students</p>
-                  <p className="text-3xl font-bold text-gray-900 mt-1" data-testid="total-students-count">{students.length}</p>
+                  <p className="text-3xl font-bold text-gray-900 mt-1" data-testid="total-students-count">{totalStudents}</p>
                 </div>
                 <div className="w-12 h-12 bg-blue-500 rounded-xl flex items-center justify-center">
                   <Users className="w-6 h-6 text-white" />
@@ -246,15 +290,28 @@ const StudentManagement = () => {
                 <CardTitle>All Students</CardTitle>
                 <CardDescription>Manage and view all student records</CardDescription>
               </div>
-              <div className="relative w-64">
-                <Search className="absolute left-3 top-1/2 transform -translate-y-1/2 w-4 h-4 text-gray-400" />
-                <Input
-                  placeholder="Search students..."
-                  data-testid="search-students-input"
-                  value={searchTerm}
-                  onChange={(e) => setSearchTerm(e.target.value)}
-                  className="pl-10"
-                />
+              <div className="flex items-center gap-3">
+                <Select value={departmentFilter} onValueChange={handleDepartmentFilter}>
+                  <SelectTrigger className="w-48" data-testid="department-filter-select">
+                    <SelectValue placeholder="All departments" />
+                  </SelectTrigger>
+                  <SelectContent>
+                    <SelectItem value={ALL_DEPARTMENTS}>All departments</SelectItem>
+                    {departments.map((dept) => (
+                      <SelectItem key={dept.id} value={dept.code}>{dept.name}</SelectItem>
+                    ))}
+                  </SelectContent>
+                </Select>
+                <div className="relative w-64">
+                  <Search className="absolute left-3 top-1/2 transform -translate-y-1/2 w-4 h-4 text-gray-400" />
+                  <Input
+                    placeholder="Search roll number or name..."
+                    data-testid="search-students-input"
+                    value={searchTerm}
+                    onChange={(e) => setSearchTerm(e.target.value)}
+                    className="pl-10"
+                  />
+                </div>
               </div>
             </div>
           </CardHeader>
@@ -320,6 +377,21 @@ const StudentManagement = () => {
                     ))}
                   </tbody>
                 </table>
+                {!searchTerm.trim() && pageCount > 1 && (
+                  <div className="flex items-center justify-between pt-4">
+                    <p className="text-sm text-gray-500">
+                      Page {page + 1} of {pageCount}
+                    </p>
+                    <div className="flex gap-2">
+                      <Button variant="outline" size="sm" onClick={() => setPage(page - 1)} disabled={page === 0} data-testid="students-prev-page">
+                        <ChevronLeft className="w-4 h-4" />
+                      </Button>
+                      <Button variant="outline" size="sm" onClick={() => setPage(page + 1)} disabled={page + 1 >= pageCount} data-testid="students-next-page">
+                        <ChevronRight className="w-4 h-4" />
+                      </Button>
+                    </div>
+                  </div>
+                )}
               </div>
             )}
           </CardContent>
@@ -73,11 +73,15 @@ export const register = (userData) => api.post('/auth/register', userData);
 export const getMe = () => api.get('/auth/me');
 
 // Students
-export const getStudents = () => api.get('/students');
+export const getStudents = (params = {}) => api.get('/students', { params });
+export const countStudents = (params = {}) => api.get('/students/count', { params });
+export const searchStudents = (q, limit = 10, department) => api.get('/students/search', { params: { q, limit, department } });
 export const createStudent = (data) => api.post('/students', data);
 export const createStudentsBulk = (data) => api.post('/students/bulk', data);
 export const updateStudent = (id, data) => api.put(`/students/${id}`, data);
 export const deleteStudent = (id) => api.delete(`/students/${id}`);
+export const updateStudentsBulk = (data) => api.post('/students/bulk/update', data);
+export const deleteStudentsBulk = (data) => api.post('/students/bulk/delete', data);
 
 // Departments
 export const getDepartments = () => api.get('/departments');
@@ -94,17 +98,76 @@ export const getExams = () => api.get('/exams');
 export const getExam = (id) => api.get(`/exams/${id}`);
 export const createExam = (data) => api.post('/exams', data);
 export const deleteExam = (id) => api.delete(`/exams/${id}`);
+export const updateExamsBulk = (data) => api.post('/exams/bulk/update', data);
+export const deleteExamsBulk = (data) => api.post('/exams/bulk/delete', data);
 
 // Seating
 export const generateSeating = (data) => api.post('/seating/generate', data);
 export const getSeatingPlans = (examId) => api.get(`/seating/exam/${examId}`);
+export const getSeatingReport = (examId) => api.get(`/seating/reports/${examId}`);
 export const exportSeatingExcel = (examId) => {
   return api.get(`/seating/export/${examId}`, {
     responseType: 'blob',
   });
 };
+export const exportSeatingDocuments = (examId) => {
+  return api.get(`/seating/documents/${examId}`, {
+    responseType: 'blob',
+  });
+};
 
 // Dashboard
 export const getDashboardStats = () => api.get('/dashboard/stats');
+export const getSeatingMetrics = (limit = 100) => api.get('/metrics/seating', { params: { limit } });
+
+// Live events (Server-Sent Events). Returns an unsubscribe function.
+// The stream is opened with a short-lived ticket rather than the login token,
+// since the ticket ends up in the URL; on any error a fresh ticket is fetched.
+export const subscribeEvents = (onEvent) => {
+  if (!localStorage.getItem('token') || typeof EventSource === 'undefined') {
+    return () => {};
+  }
+  let source = null;
+  let retryTimer = null;
+  let closed = false;
+
+  const connect = async () => {
+    try {
+      const response = await api.post('/events/ticket');
+      if (closed) {
+        return;
+      }
+      source = new EventSource(`${API_BASE}/events/stream?ticket=${encodeURIComponent(response.data.ticket)}`);
+      source.onmessage = (message) => {
+        try {
+          onEvent(JSON.parse(message.data));
+        } catch (error) {
+          console.error('Error parsing event:', error);
+        }
+      };
+      source.onerror = () => {
+        source.close();
+        scheduleReconnect();
+      };
+    } catch (error) {
+      scheduleReconnect();
+    }
+  };
+
+  const scheduleReconnect = () => {
+    if (!closed) {
+      retryTimer = setTimeout(connect, 5000);
+    }
+  };
+
+  connect();
+  return () => {
+    closed = true;
+    clearTimeout(retryTimer);
+    if (source) {
+      source.close();
+    }
+  };
+};
 
 export default api;
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+One-time migration: convert created_at ISO strings to native BSON dates.
+
+Safe to run repeatedly - only documents whose created_at is still a string are
+touched, so a second run is a no-op.
+"""
+import os
+import asyncio
+from datetime import datetime, timezone
+from pathlib import Path
+
+from dotenv import load_dotenv
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import UpdateOne
+
+load_dotenv(Path(__file__).parent.parent / 'backend' / '.env')
+
+MONGO_URL = os.environ.get('MONGO_URL', 'mongodb://localhost:27017')
+DB_NAME = os.environ.get('DB_NAME', 'autoseater_db')
+COLLECTIONS = ["users", "students", "departments", "rooms", "exams", "seating_plans"]
+BATCH_SIZE = 1000
+
+def parse_timestamp(value: str) -> datetime:
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+async def migrate_collection(collection) -> int:
+    migrated = 0
+    batch = []
+    cursor = collection.find({"created_at": {"$type": "string"}}, {"_id": 1, "created_at": 1})
+    async for doc in cursor:
+        batch.append(UpdateOne(
+            # Re-check the type so concurrent writers are never overwritten
+            {"_id": doc["_id"], "created_at": {"$type": "string"}},
+            {"$set": {"created_at": parse_timestamp(doc["created_at"])}}
+        ))
+        if len(batch) >= BATCH_SIZE:
+            result = await collection.bulk_write(batch, ordered=False)
+            migrated += result.modified_count
+            batch = []
+    if batch:
+        result = await collection.bulk_write(batch, ordered=False)
+        migrated += result.modified_count
+    return migrated
+
+async def migrate():
+    client = AsyncIOMotorClient(MONGO_URL)
+    db = client[DB_NAME]
+    
+    print("Migrating created_at fields to BSON dates...")
+    for name in COLLECTIONS:
+        migrated = await migrate_collection(db[name])
+        print(f"✓ {name}: {migrated} document(s) migrated")
+    
+    client.close()
+
+if __name__ == "__main__":
+    asyncio.run(migrate())
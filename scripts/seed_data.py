@@ -42,7 +42,7 @@ async def seed_database():
         "email": "admin@autoseater.com",
         "password": pwd_context.hash("admin123"),
         "role": "admin",
-        "created_at": datetime.now(timezone.utc).isoformat()
+        "created_at": datetime.now(timezone.utc)
     }
     await db.users.insert_one(admin_data)
     print("✓ Created admin user (username: admin, password: admin123)")
@@ -55,7 +55,7 @@ async def seed_database():
         "email": "invigilator@autoseater.com",
         "password": pwd_context.hash("invigi123"),
         "role": "invigilator",
-        "created_at": datetime.now(timezone.utc).isoformat()
+        "created_at": datetime.now(timezone.utc)
     }
     await db.users.insert_one(invigilator_data)
     print("✓ Created invigilator user (username: invigilator, password: invigi123)")
@@ -67,28 +67,28 @@ async def seed_database():
             "name": "Computer Science Engineering",
             "code": "CSE",
             "subjects": ["English", "DBMS", "Data Structures", "Algorithms", "Operating Systems"],
-            "created_at": datetime.now(timezone.utc).isoformat()
+            "created_at": datetime.now(timezone.utc)
         },
         {
             "id": str(uuid.uuid4()),
             "name": "Information Technology",
             "code": "IT",
             "subjects": ["English", "Networks", "Web Development", "Cloud Computing", "DBMS"],
-            "created_at": datetime.now(timezone.utc).isoformat()
+            "created_at": datetime.now(timezone.utc)
         },
         {
             "id": str(uuid.uuid4()),
             "name": "Electronics & Communication",
             "code": "ECE",
             "subjects": ["English", "Digital Electronics", "Signal Processing", "Communications"],
-            "created_at": datetime.now(timezone.utc).isoformat()
+            "created_at": datetime.now(timezone.utc)
         },
         {
             "id": str(uuid.uuid4()),
             "name": "Artificial Intelligence & Data Science",
             "code": "AIDS",
             "subjects": ["English", "Machine Learning", "Deep Learning", "Data Mining", "AI"],
-            "created_at": datetime.now(timezone.utc).isoformat()
+            "created_at": datetime.now(timezone.utc)
         }
     ]
     await db.departments.insert_many(departments)
@@ -103,7 +103,7 @@ async def seed_database():
             "desk_count": 30,
             "rows": 5,
             "columns": 6,
-            "created_at": datetime.now(timezone.utc).isoformat()
+            "created_at": datetime.now(timezone.utc)
         },
         {
             "id": str(uuid.uuid4()),
@@ -112,7 +112,7 @@ async def seed_database():
             "desk_count": 25,
             "rows": 5,
             "columns": 5,
-            "created_at": datetime.now(timezone.utc).isoformat()
+            "created_at": datetime.now(timezone.utc)
         },
         {
             "id": str(uuid.uuid4()),
@@ -121,7 +121,7 @@ async def seed_database():
             "desk_count": 40,
             "rows": 5,
             "columns": 8,
-            "created_at": datetime.now(timezone.utc).isoformat()
+            "created_at": datetime.now(timezone.utc)
         },
         {
             "id": str(uuid.uuid4()),
@@ -130,7 +130,7 @@ async def seed_database():
             "desk_count": 60,
             "rows": 6,
             "columns": 10,
-            "created_at": datetime.now(timezone.utc).isoformat()
+            "created_at": datetime.now(timezone.utc)
         }
     ]
     await db.rooms.insert_many(rooms)
@@ -163,10 +163,11 @@ async def seed_database():
                 "id": str(uuid.uuid4()),
                 "roll_number": f"23B{dept}{roll_num:03d}",
                 "name": names[name_idx],
+                "name_lower": names[name_idx].lower(),
                 "department": dept,
                 "subjects": subjects_map[dept],
                 "email": f"student{roll_num}@college.edu",
-                "created_at": datetime.now(timezone.utc).isoformat()
+                "created_at": datetime.now(timezone.utc)
             }
             students.append(student)
             roll_num += 1
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Snapshot and restore the AutoSeater+ database as zstd-compressed Parquet files.
+
+    python3 scripts/snapshot.py export snapshots/2025-11-01
+    python3 scripts/snapshot.py restore snapshots/2025-11-01 --drop
+
+Each collection is written to <collection>.parquet alongside a manifest.json
+that records document counts and index definitions. Export streams the cursor
+in chunks, so memory stays bounded by the chunk size; a first pass unifies the
+column types of every document into one schema. Restore feeds batches to a
+fixed number of concurrent unordered insert_many calls, reading the next batch
+only when an insert slot frees up, and rebuilds the indexes afterwards, which
+is much faster than maintaining them per insert. Restore refuses to load into
+non-empty collections unless --drop is given.
+"""
+import os
+import sys
+import json
+import asyncio
+import argparse
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from dotenv import load_dotenv
+from motor.motor_asyncio import AsyncIOMotorClient
+from bson.codec_options import CodecOptions
+from datetime import timezone
+
+load_dotenv(Path(__file__).parent.parent / 'backend' / '.env')
+
+MONGO_URL = os.environ.get('MONGO_URL', 'mongodb://localhost:27017')
+DB_NAME = os.environ.get('DB_NAME', 'autoseater_db')
+COLLECTIONS = ["users", "departments", "rooms", "students", "exams", "seating_plans", "seating_reports", "counters"]
+INSERT_BATCH_SIZE = 10000
+INSERT_CONCURRENCY = 4
+COMPRESSION = "zstd"
+EXPORT_BATCH_SIZE = 10000
+# Free-form dicts (arbitrary keys per document) are stored as Arrow maps; inferring
+# them as structs would merge every document's keys into one set of columns
+MAP_FIELDS = {
+    "seating_reports": {"adjacency_violations": pa.map_(pa.string(), pa.int64())},
+}
+
+def get_db(client: AsyncIOMotorClient):
+    return client.get_database(DB_NAME, codec_options=CodecOptions(tz_aware=True, tzinfo=timezone.utc))
+
+async def iter_chunks(collection, size: int = EXPORT_BATCH_SIZE):
+    # _id is not used by the API (documents are addressed by "id"), so it is not exported
+    chunk = []
+    async for doc in collection.find({}, {"_id": 0}, batch_size=size):
+        chunk.append(doc)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+async def collection_schema(collection, map_fields: Optional[Dict[str, pa.DataType]] = None) -> pa.Schema:
+    """Union of the columns (and promoted types) of every document, so sparse fields survive the export."""
+    # pa.array infers a struct over every key in the chunk (from_pylist would only look at the first row)
+    schemas = [pa.schema(list(pa.array(chunk).type)) async for chunk in iter_chunks(collection)]
+    if not schemas:
+        return pa.schema([])
+    schema = pa.unify_schemas(schemas, promote_options="permissive")
+    map_fields = map_fields or {}
+    for i, field in enumerate(schema):
+        if field.name in map_fields:
+            schema = schema.set(i, pa.field(field.name, map_fields[field.name]))
+        elif pa.types.is_struct(field.type) and field.type.num_fields == 0:
+            # Only ever seen as {}: Parquet cannot store an empty struct, but an empty map is fine
+            schema = schema.set(i, pa.field(field.name, pa.map_(pa.string(), pa.string())))
+    return schema
+
+async def export_collection(db, name: str, target: Path) -> dict:
+    collection = db[name]
+    count = 0
+    try:
+        schema = await collection_schema(collection, MAP_FIELDS.get(name))
+    except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+        sys.exit(f"{name}: documents disagree on a field type ({e}); normalise it first (scripts/migrate_datetimes.py handles created_at)")
+
+    if len(schema):
+        with pq.ParquetWriter(target / f"{name}.parquet", schema, compression=COMPRESSION) as writer:
+            async for chunk in iter_chunks(collection):
+                writer.write_table(pa.Table.from_pylist(chunk, schema=schema))
+                count += len(chunk)
+
+    indexes = []
+    for index_name, info in (await collection.index_information()).items():
+        if index_name == "_id_":
+            continue
+        options = {k: v for k, v in info.items() if k not in ("key", "v", "ns")}
+        indexes.append({"name": index_name, "key": info["key"], "options": options})
+    return {"count": count, "indexes": indexes}
+
+async def export_snapshot(target: Path):
+    client = AsyncIOMotorClient(MONGO_URL)
+    db = get_db(client)
+    target.mkdir(parents=True, exist_ok=True)
+
+    manifest = {"database": DB_NAME, "collections": {}}
+    for name in COLLECTIONS:
+        started = time.perf_counter()
+        manifest["collections"][name] = await export_collection(db, name, target)
+        print(f"✓ {name}: {manifest['collections'][name]['count']} document(s) in {time.perf_counter() - started:.2f}s")
+
+    (target / "manifest.json").write_text(json.dumps(manifest, indent=2, default=str))
+    client.close()
+
+async def restore_collection(db, name: str, source: Path, entry: dict, drop: bool) -> int:
+    collection = db[name]
+    if drop:
+        await collection.drop()
+
+    path = source / f"{name}.parquet"
+    restored = 0
+    if path.exists():
+        # Bounded hand-off: the reader blocks once every insert slot has a batch waiting
+        queue: asyncio.Queue = asyncio.Queue(maxsize=INSERT_CONCURRENCY)
+        errors = []
+
+        async def insert_batches() -> int:
+            inserted = 0
+            while (docs := await queue.get()) is not None:
+                # After a failure keep draining so the reader never blocks on a full queue
+                if errors:
+                    continue
+                try:
+                    result = await collection.insert_many(docs, ordered=False)
+                    inserted += len(result.inserted_ids)
+                except Exception as e:
+                    errors.append(e)
+            return inserted
+
+        inserters = [asyncio.create_task(insert_batches()) for _ in range(INSERT_CONCURRENCY)]
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=INSERT_BATCH_SIZE):
+            if errors:
+                break
+            # Parquet fills absent fields with nulls; drop them so sparse documents come back as they were
+            rows = batch.to_pylist(maps_as_pydicts="strict")
+            await queue.put([{k: v for k, v in row.items() if v is not None} for row in rows])
+        for _ in inserters:
+            await queue.put(None)
+        restored = sum(await asyncio.gather(*inserters))
+        if errors:
+            raise errors[0]
+
+    for index in entry.get("indexes", []):
+        await collection.create_index([tuple(k) for k in index["key"]], name=index["name"], **index["options"])
+    return restored
+
+async def restore_snapshot(source: Path, drop: bool):
+    manifest = json.loads((source / "manifest.json").read_text())
+    client = AsyncIOMotorClient(MONGO_URL)
+    db = get_db(client)
+    names = [name for name in COLLECTIONS if name in manifest["collections"]]
+
+    # Loading on top of existing documents would duplicate them, so check everything before writing anything
+    if not drop:
+        occupied = [name for name in names if await db[name].find_one({}, {"_id": 1})]
+        if occupied:
+            client.close()
+            sys.exit(f"Refusing to restore into non-empty collection(s): {', '.join(occupied)} (use --drop)")
+
+    for name in names:
+        started = time.perf_counter()
+        restored = await restore_collection(db, name, source, manifest["collections"][name], drop)
+        print(f"✓ {name}: {restored} document(s) in {time.perf_counter() - started:.2f}s")
+
+    client.close()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    export_parser = subparsers.add_parser("export", help="Dump all collections to a snapshot directory")
+    export_parser.add_argument("path", type=Path)
+    restore_parser = subparsers.add_parser("restore", help="Load a snapshot directory into the database")
+    restore_parser.add_argument("path", type=Path)
+    restore_parser.add_argument("--drop", action="store_true", help="Drop each collection before loading it")
+    args = parser.parse_args()
+
+    if args.command == "export":
+        asyncio.run(export_snapshot(args.path))
+    else:
+        if not (args.path / "manifest.json").exists():
+            sys.exit(f"No manifest.json in {args.path}")
+        asyncio.run(restore_snapshot(args.path, args.drop))
+
+if __name__ == "__main__":
+    main()
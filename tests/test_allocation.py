@@ -0,0 +1,95 @@
+from collections import Counter
+
+import pytest
+
+from server import SeatingMode, allocate_seating, allocation_cache_key, desk_layout
+
+SUBJECTS = ["DBMS", "Networks", "AI"]
+
+
+def make_students(count):
+    return [
+        {"id": f"id{i}", "roll_number": f"R{i:04d}", "subjects": [SUBJECTS[i % len(SUBJECTS)]]}
+        for i in range(count)
+    ]
+
+
+def make_rooms(*geometries):
+    return [
+        {"id": f"room{n}", "name": f"Room {n}", "rows": rows, "columns": columns, "desk_count": desks}
+        for n, (rows, columns, desks) in enumerate(geometries)
+    ]
+
+
+def seated_rolls(room_allocations):
+    return [
+        roll
+        for _, desks in room_allocations
+        for desk in desks
+        for roll in (desk.left_student, desk.right_student)
+        if roll
+    ]
+
+
+def test_desk_layout_walks_rows_and_stops_at_desk_count():
+    assert desk_layout(2, 3, 4) == ((1, 0, 0), (2, 0, 1), (3, 0, 2), (4, 1, 0))
+    assert len(desk_layout(2, 3, 10)) == 6
+
+
+@pytest.mark.parametrize("mode", list(SeatingMode))
+def test_no_student_is_seated_twice_across_rooms(mode):
+    students = make_students(90)
+    rooms = make_rooms((3, 4, 12), (4, 5, 20), (2, 5, 10))
+    room_allocations, seated = allocate_seating(students, rooms, SUBJECTS, mode)
+    rolls = seated_rolls(room_allocations)
+    assert max(Counter(rolls).values()) == 1
+    assert seated == len(rolls)
+
+
+@pytest.mark.parametrize("mode", list(SeatingMode))
+def test_everyone_is_seated_when_capacity_covers_demand(mode):
+    students = make_students(60)
+    rooms = make_rooms((5, 6, 30), (5, 6, 30))
+    _, seated = allocate_seating(students, rooms, SUBJECTS, mode)
+    assert seated == 60
+
+
+def test_cat_mode_seats_every_subject_and_pairs_different_subjects():
+    students = make_students(30)
+    room_allocations, seated = allocate_seating(students, make_rooms((5, 6, 30)), SUBJECTS, SeatingMode.TWO_PER_DESK)
+    subject_of = {s["roll_number"]: s["subjects"][0] for s in students}
+    assert seated == 30
+    paired = [d for _, desks in room_allocations for d in desks if d.right_student]
+    assert all(subject_of[d.left_student] != subject_of[d.right_student] for d in paired[:10])
+
+
+def test_semester_mode_keeps_roll_number_order():
+    students = make_students(15)
+    room_allocations, _ = allocate_seating(students, make_rooms((2, 5, 10), (2, 5, 10)), SUBJECTS, SeatingMode.ONE_PER_DESK)
+    assert seated_rolls(room_allocations) == [s["roll_number"] for s in students]
+
+
+def test_desk_limit_caps_a_room_below_its_desk_count():
+    rooms = make_rooms((5, 6, 30))
+    rooms[0]["desk_limit"] = 7
+    _, seated = allocate_seating(make_students(20), rooms, SUBJECTS, SeatingMode.ONE_PER_DESK)
+    assert seated == 7
+
+
+def test_same_seed_reproduces_cat_allocation_and_other_seeds_differ():
+    students = make_students(60)
+    rooms = make_rooms((5, 6, 30))
+    first = allocate_seating(students, rooms, SUBJECTS, SeatingMode.TWO_PER_DESK, seed=7)
+    again = allocate_seating(students, rooms, SUBJECTS, SeatingMode.TWO_PER_DESK, seed=7)
+    other = allocate_seating(students, rooms, SUBJECTS, SeatingMode.TWO_PER_DESK, seed=8)
+    assert seated_rolls(first[0]) == seated_rolls(again[0])
+    assert seated_rolls(first[0]) != seated_rolls(other[0])
+
+
+def test_cache_key_changes_with_students_version_and_geometry():
+    exam = {"id": "e1", "departments": ["CSE"], "subjects": SUBJECTS}
+    rooms = make_rooms((5, 6, 30))
+    key = allocation_cache_key(exam, rooms, SeatingMode.TWO_PER_DESK, 1, "v1")
+    assert key == allocation_cache_key(exam, make_rooms((5, 6, 30)), SeatingMode.TWO_PER_DESK, 1, "v1")
+    assert key != allocation_cache_key(exam, rooms, SeatingMode.TWO_PER_DESK, 1, "v2")
+    assert key != allocation_cache_key(exam, make_rooms((5, 6, 29)), SeatingMode.TWO_PER_DESK, 1, "v1")
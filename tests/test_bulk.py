@@ -0,0 +1,167 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+import server
+from server import bulk_delete, bulk_target_query, bulk_update, invalidate_student_seating
+
+
+class FakeCursor:
+    def __init__(self, docs):
+        self.docs = docs
+
+    async def to_list(self, length):
+        return self.docs
+
+
+class FakeResult:
+    def __init__(self, matched_count=0, deleted_count=0):
+        self.matched_count = matched_count
+        self.deleted_count = deleted_count
+
+
+class FakeCollection:
+    """Just enough of a Motor collection for equality and $in filters."""
+
+    def __init__(self, docs):
+        self.docs = [dict(d) for d in docs]
+
+    def _matches(self, doc, query):
+        for key, value in query.items():
+            if isinstance(value, dict):
+                if doc.get(key) not in value["$in"]:
+                    return False
+            elif doc.get(key) != value:
+                return False
+        return True
+
+    async def update_many(self, query, update):
+        matched = [d for d in self.docs if self._matches(d, query)]
+        for doc in matched:
+            doc.update(update.get("$set", {}))
+            for key in update.get("$unset", {}):
+                doc.pop(key, None)
+        return FakeResult(matched_count=len(matched))
+
+    def find(self, query, projection):
+        fields = [k for k, v in projection.items() if v]
+        return FakeCursor([{f: d[f] for f in fields} for d in self.docs if self._matches(d, query)])
+
+    async def delete_many(self, query):
+        kept = [d for d in self.docs if not self._matches(d, query)]
+        deleted = len(self.docs) - len(kept)
+        self.docs = kept
+        return FakeResult(deleted_count=deleted)
+
+
+def students():
+    return FakeCollection([
+        {"id": "s1", "roll_number": "R1", "department": "CSE"},
+        {"id": "s2", "roll_number": "R2", "department": "CSE"},
+        {"id": "s3", "roll_number": "R3", "department": "ECE"},
+    ])
+
+
+def test_empty_filter_without_ids_is_rejected():
+    with pytest.raises(HTTPException) as exc:
+        bulk_target_query(None, {})
+    assert exc.value.status_code == 400
+
+
+def test_id_list_is_combined_with_filter():
+    assert bulk_target_query(["s1"], {"department": "CSE"}) == {"department": "CSE", "id": {"$in": ["s1"]}}
+
+
+def test_bulk_update_reports_missing_ids_and_returns_projected_documents():
+    collection = students()
+    result, updated = asyncio.run(
+        bulk_update(collection, ["s1", "s9"], {}, {"department": "EEE"}, fields=("roll_number",))
+    )
+    assert result["matched"] == 1
+    assert result["results"] == [{"id": "s1", "status": "updated"}, {"id": "s9", "status": "not_found"}]
+    assert updated == [{"id": "s1", "roll_number": "R1"}]
+    # The claim stamp does not outlive the request
+    assert not any("bulk_op_id" in d for d in collection.docs)
+
+
+def test_bulk_update_without_fields_is_rejected():
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(bulk_update(students(), ["s1"], {}, {}))
+    assert exc.value.status_code == 400
+
+
+def test_bulk_delete_by_filter_reports_each_deleted_document():
+    collection = students()
+    result, deleted = asyncio.run(bulk_delete(collection, None, {"department": "CSE"}))
+    assert result["deleted"] == 2
+    assert [r["id"] for r in result["results"]] == ["s1", "s2"]
+    assert [d["id"] for d in collection.docs] == ["s3"]
+    assert len(deleted) == 2
+
+
+def test_results_only_cover_documents_this_write_claimed():
+    collection = students()
+    # A document stamped by an earlier bulk operation must not leak into this one
+    collection.docs[2]["bulk_op_id"] = "earlier"
+    result, _ = asyncio.run(bulk_delete(collection, ["s1"], {}))
+    assert result["results"] == [{"id": "s1", "status": "deleted"}]
+    assert len(collection.docs) == 2
+
+
+class RecordingCollection:
+    def __init__(self, distinct_result=()):
+        self.distinct_result = list(distinct_result)
+        self.queries = []
+
+    async def distinct(self, field, query):
+        self.queries.append(query)
+        return self.distinct_result
+
+    async def delete_many(self, query):
+        self.queries.append(query)
+        return FakeResult(deleted_count=2)
+
+
+class FakeDatabase:
+    def __init__(self):
+        self.exams = RecordingCollection(["cse-dbms"])
+        self.seating_plans = RecordingCollection(["cse-dbms"])
+
+
+@pytest.fixture
+def fake_db(monkeypatch):
+    database = FakeDatabase()
+    events = []
+
+    async def record_event(event_type, collection, **data):
+        events.append((event_type, data))
+
+    monkeypatch.setattr(server, "db", database)
+    monkeypatch.setattr(server, "publish_event", record_event)
+    return database, events
+
+
+def test_eligibility_uses_each_students_resulting_department_and_subjects(fake_db):
+    database, events = fake_db
+    updated = [
+        {"id": "s1", "roll_number": "R1", "department": "CSE", "subjects": ["English", "DBMS"]},
+        {"id": "s2", "roll_number": "R2", "department": "CSE", "subjects": ["DBMS", "English"]},
+    ]
+    exam_ids, removed = asyncio.run(invalidate_student_seating(updated, eligibility_changed=True))
+    # One clause per distinct profile, each pinned to the department, never a bare subject match
+    assert database.exams.queries == [
+        {"$or": [{"departments": "CSE", "subjects": {"$in": ["DBMS", "English"]}}]}
+    ]
+    plans_query = database.seating_plans.queries[0]["$or"]
+    assert {"exam_id": {"$in": ["cse-dbms"]}} in plans_query
+    assert {"desk_assignments.left_student": {"$in": ["R1", "R2"]}} in plans_query
+    assert (exam_ids, removed) == (["cse-dbms"], 2)
+    assert events == [("seating.invalidated", {"exam_ids": ["cse-dbms"]})]
+
+
+def test_deletion_only_invalidates_exams_that_seat_the_students(fake_db):
+    database, _ = fake_db
+    asyncio.run(invalidate_student_seating([{"id": "s1", "roll_number": "R1"}]))
+    assert database.exams.queries == []
+    assert all("exam_id" not in clause for clause in database.seating_plans.queries[0]["$or"])
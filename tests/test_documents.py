@@ -0,0 +1,32 @@
+from documents import render_batch
+
+EXAM = {"exam_name": "CAT 1", "exam_type": "CAT", "date": "2025-11-01", "time": "10:00"}
+
+
+def test_hall_tickets_are_pdfs_named_by_roll_number():
+    ticket = {
+        "roll_number": "23BCSE001", "name": "Arjun Kumar", "department": "CSE",
+        "room_name": "Room 101", "desk_number": 1, "row": 0, "col": 0, "side": "Left"
+    }
+    [(name, pdf)] = render_batch("hall_ticket", EXAM, [ticket])
+    assert name == "hall_tickets/23BCSE001.pdf"
+    assert pdf.startswith(b"%PDF")
+
+
+def test_roll_numbers_with_separators_stay_flat_in_the_archive():
+    ticket = {
+        "roll_number": "21/CS/001", "name": "Meera Iyer", "department": "CSE",
+        "room_name": "Room 101", "desk_number": 2, "row": 0, "col": 1, "side": "Right"
+    }
+    [(name, _)] = render_batch("hall_ticket", EXAM, [ticket])
+    assert name == "hall_tickets/21_CS_001.pdf"
+
+
+def test_door_sheets_with_the_same_room_name_get_distinct_entries():
+    desks = [{"desk_number": 1, "row": 0, "col": 0, "left_student": "23BCSE001", "right_student": None}]
+    sheets = [
+        {"room_id": "r1", "room_name": "Lab/A", "desks": desks, "total_students": 1},
+        {"room_id": "r2", "room_name": "Lab/A", "desks": desks, "total_students": 1},
+    ]
+    names = [name for name, _ in render_batch("door_sheet", EXAM, sheets)]
+    assert names == ["door_sheets/Lab_A_r1.pdf", "door_sheets/Lab_A_r2.pdf"]
@@ -0,0 +1,48 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from server import EventBus, create_access_token, create_event_ticket, get_user_from_token
+
+
+def test_publish_fans_out_to_every_subscriber():
+    bus = EventBus()
+    first, second = bus.subscribe(), bus.subscribe()
+    bus.publish("student.created", "students", id="s1")
+    for queue in (first, second):
+        event = queue.get_nowait()
+        assert event["type"] == "student.created"
+        assert event["collection"] == "students"
+        assert event["id"] == "s1"
+        assert event["seq"] == 1
+
+
+def test_slow_subscriber_drops_oldest_events():
+    bus = EventBus(max_queue_size=2)
+    queue = bus.subscribe()
+    for n in range(3):
+        bus.publish("room.created", "rooms", room=n)
+    assert [queue.get_nowait()["room"] for _ in range(2)] == [1, 2]
+
+
+def test_unsubscribed_queue_receives_nothing():
+    bus = EventBus()
+    queue = bus.subscribe()
+    bus.unsubscribe(queue)
+    bus.publish("exam.deleted", "exams", exam_id="e1")
+    assert queue.empty()
+
+
+def test_event_ticket_is_not_an_api_credential():
+    ticket = create_event_ticket("user-1")
+    with pytest.raises(HTTPException) as excinfo:
+        asyncio.run(get_user_from_token(ticket))
+    assert excinfo.value.status_code == 401
+
+
+def test_access_token_cannot_open_event_stream():
+    token = create_access_token({"sub": "user-1"})
+    with pytest.raises(HTTPException) as excinfo:
+        asyncio.run(get_user_from_token(token, purpose="events"))
+    assert excinfo.value.status_code == 401
@@ -0,0 +1,57 @@
+import pytest
+from fastapi import HTTPException
+
+from server import RoomSelection, SeatingMode, room_seat_capacity, select_rooms
+
+
+def make_room(room_id, desks, rows, columns):
+    return {"id": room_id, "name": room_id, "desk_count": desks, "rows": rows, "columns": columns}
+
+
+ROOMS = [
+    make_room("r30a", 30, 5, 6),
+    make_room("r30b", 30, 5, 6),
+    make_room("r20", 20, 4, 5),
+    make_room("r10", 10, 2, 5),
+]
+
+
+def usable_seats(rooms, mode):
+    per_desk = 2 if mode == SeatingMode.TWO_PER_DESK else 1
+    return sum(min(room_seat_capacity(r, mode), r.get("desk_limit", r["desk_count"]) * per_desk) for r in rooms)
+
+
+def test_capacity_is_limited_by_layout_and_doubled_for_cat():
+    room = make_room("r", 40, 5, 6)
+    assert room_seat_capacity(room, SeatingMode.ONE_PER_DESK) == 30
+    assert room_seat_capacity(room, SeatingMode.TWO_PER_DESK) == 60
+
+
+def test_minimal_uses_fewest_rooms_with_best_fit_last_room():
+    chosen = select_rooms(ROOMS, 45, SeatingMode.ONE_PER_DESK, RoomSelection.MINIMAL)
+    assert [r["id"] for r in chosen] == ["r30a", "r20"]
+
+
+def test_balanced_caps_desks_for_even_fill_without_touching_desk_count():
+    chosen = select_rooms(ROOMS, 45, SeatingMode.ONE_PER_DESK, RoomSelection.BALANCED)
+    assert len(chosen) == 2
+    assert sum(r["desk_limit"] for r in chosen) == 45
+    for room in chosen:
+        original = next(r for r in ROOMS if r["id"] == room["id"])
+        assert room["desk_count"] == original["desk_count"]
+        assert room["desk_limit"] <= room["desk_count"]
+
+
+@pytest.mark.parametrize("strategy", [RoomSelection.MINIMAL, RoomSelection.BALANCED])
+@pytest.mark.parametrize("mode", list(SeatingMode))
+@pytest.mark.parametrize("demand", [1, 19, 45, 61, 90])
+def test_selection_always_covers_demand(strategy, mode, demand):
+    chosen = select_rooms(ROOMS, demand, mode, strategy)
+    assert len({r["id"] for r in chosen}) == len(chosen)
+    assert usable_seats(chosen, mode) >= demand
+
+
+def test_insufficient_capacity_is_rejected():
+    with pytest.raises(HTTPException) as excinfo:
+        select_rooms(ROOMS, 91, SeatingMode.ONE_PER_DESK, RoomSelection.MINIMAL)
+    assert excinfo.value.status_code == 400
@@ -0,0 +1,50 @@
+from server import DeskAssignment, SeatingMode, build_seating_report
+
+ROOM = {"id": "r1", "name": "Room 1", "rows": 2, "columns": 3, "desk_count": 6}
+
+
+def students(**subject_by_roll):
+    return [{"roll_number": roll, "subjects": [subject]} for roll, subject in subject_by_roll.items()]
+
+
+def desk(number, row, col, left=None, right=None):
+    return DeskAssignment(desk_number=number, row=row, col=col, left_student=left, right_student=right)
+
+
+def test_interleaved_cat_row_has_no_violations():
+    # A0|B0, A1|B1, A2|B2: each B sits next to the following A, never next to another B
+    eligible = students(A0="A", B0="B", A1="A", B1="B", A2="A", B2="B")
+    desks = [desk(1, 0, 0, "A0", "B0"), desk(2, 0, 1, "A1", "B1"), desk(3, 0, 2, "A2", "B2")]
+    report = build_seating_report(eligible, [(ROOM, desks)], ["A", "B"], SeatingMode.TWO_PER_DESK)
+    assert report["total_adjacency_violations"] == 0
+
+
+def test_same_subject_on_one_desk_and_across_the_desk_gap():
+    eligible = students(A0="A", A1="A", B0="B", A2="A")
+    desks = [desk(1, 0, 0, "A0", "A1"), desk(2, 0, 1, "A2", "B0")]
+    report = build_seating_report(eligible, [(ROOM, desks)], ["A", "B"], SeatingMode.TWO_PER_DESK)
+    # A0|A1 share a desk, and A1 touches A2 across the gap between desks
+    assert report["adjacency_violations"] == {"A": 2}
+
+
+def test_rows_compare_matching_seats_only():
+    eligible = students(A0="A", B0="B", B1="B", A1="A")
+    desks = [desk(1, 0, 0, "A0", "B0"), desk(4, 1, 0, "B1", "A1")]
+    report = build_seating_report(eligible, [(ROOM, desks)], ["A", "B"], SeatingMode.TWO_PER_DESK)
+    # Diagonal neighbours (A0/A1, B0/B1) are not adjacent
+    assert report["total_adjacency_violations"] == 0
+
+    desks = [desk(1, 0, 0, "A0", "B0"), desk(4, 1, 0, "A1", "B1")]
+    report = build_seating_report(eligible, [(ROOM, desks)], ["A", "B"], SeatingMode.TWO_PER_DESK)
+    assert report["adjacency_violations"] == {"A": 1, "B": 1}
+
+
+def test_fill_rate_and_unseated_students():
+    eligible = students(S1="A", S2="A", S3="A")
+    desks = [desk(1, 0, 0, "S1"), desk(2, 0, 1, "S2")]
+    report = build_seating_report(eligible, [(ROOM, desks)], ["A"], SeatingMode.ONE_PER_DESK)
+    assert report["total_students_assigned"] == 2
+    assert report["unseated_students"] == ["S3"]
+    assert report["rooms"][0].fill_rate == round(2 / 6, 4)
+    # One student per desk leaves an empty seat between neighbours in a row
+    assert report["total_adjacency_violations"] == 0
@@ -0,0 +1,108 @@
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+import snapshot
+from server import SeatingPlan, SeatingReport
+
+
+class FakeCursor:
+    def __init__(self, docs):
+        self.docs = docs
+
+    async def __aiter__(self):
+        for doc in self.docs:
+            yield dict(doc)
+
+
+class FakeInsertResult:
+    def __init__(self, count):
+        self.inserted_ids = list(range(count))
+
+
+class FakeCollection:
+    def __init__(self, docs=()):
+        self.docs = list(docs)
+
+    def find(self, query, projection, batch_size=None):
+        return FakeCursor(self.docs)
+
+    async def index_information(self):
+        return {"_id_": {"key": [("_id", 1)], "v": 2}, "exam_id": {"key": [("exam_id", 1)], "v": 2}}
+
+    async def insert_many(self, docs, ordered):
+        self.docs.extend(docs)
+        return FakeInsertResult(len(docs))
+
+    async def create_index(self, keys, name, **options):
+        pass
+
+    async def drop(self):
+        self.docs = []
+
+
+def round_trip(tmp_path, name, docs):
+    entry = asyncio.run(snapshot.export_collection({name: FakeCollection(docs)}, name, tmp_path))
+    target = FakeCollection()
+    restored = asyncio.run(snapshot.restore_collection({name: target}, name, tmp_path, entry, drop=False))
+    assert entry["count"] == restored == len(docs)
+    return target.docs
+
+
+def report(exam_id, violations):
+    return SeatingReport(
+        exam_id=exam_id,
+        seating_mode="two_per_desk",
+        room_selection="minimal",
+        total_eligible_students=4,
+        total_students_assigned=4,
+        unseated_students=[],
+        rooms=[{"room_id": "r1", "room_name": "Room 1", "seat_capacity": 4, "students_seated": 4, "fill_rate": 1.0}],
+        overall_fill_rate=1.0,
+        adjacency_violations=violations,
+        total_adjacency_violations=sum(violations.values()),
+        timings_ms={"fetch": 1.0, "allocate": 2.0, "write": 3.0, "total": 6.0},
+        allocation_cache_hit=False,
+    ).model_dump()
+
+
+@pytest.fixture(autouse=True)
+def small_batches(monkeypatch):
+    # Several chunks per collection, so schemas are unified across batches
+    monkeypatch.setattr(snapshot, "EXPORT_BATCH_SIZE", 2)
+    monkeypatch.setattr(snapshot, "INSERT_BATCH_SIZE", 2)
+
+
+def test_reports_with_only_empty_violations_round_trip(tmp_path):
+    docs = [report("e1", {}), report("e2", {})]
+    restored = round_trip(tmp_path, "seating_reports", docs)
+    assert [SeatingReport(**d).adjacency_violations for d in restored] == [{}, {}]
+
+
+def test_reports_with_mixed_violation_keys_keep_their_own_keys(tmp_path):
+    docs = [report("e1", {"A": 2}), report("e2", {"B": 1}), report("e3", {}), report("e4", {"A": 1, "C": 3})]
+    restored = round_trip(tmp_path, "seating_reports", docs)
+    assert [d["adjacency_violations"] for d in restored] == [{"A": 2}, {"B": 1}, {}, {"A": 1, "C": 3}]
+    assert [SeatingReport(**d).created_at for d in restored] == [d["created_at"] for d in docs]
+
+
+def test_plans_with_empty_right_seats_round_trip(tmp_path):
+    desks = [
+        {"desk_number": 1, "left_student": "R1", "right_student": None, "row": 0, "col": 0},
+        {"desk_number": 2, "left_student": "R2", "right_student": "R3", "row": 0, "col": 1},
+    ]
+    docs = [
+        {"id": "p1", "exam_id": "e1", "room_id": "r1", "seating_mode": "two_per_desk",
+         "desk_assignments": desks[:1], "total_students": 1,
+         "created_at": datetime(2025, 1, 1, tzinfo=timezone.utc)},
+        {"id": "p2", "exam_id": "e1", "room_id": "r2", "seating_mode": "two_per_desk",
+         "desk_assignments": desks, "total_students": 3,
+         "created_at": datetime(2025, 1, 2, tzinfo=timezone.utc)},
+        {"id": "p3", "exam_id": "e2", "room_id": "r1", "seating_mode": "two_per_desk",
+         "desk_assignments": desks[:1], "total_students": 1,
+         "created_at": datetime(2025, 1, 3, tzinfo=timezone.utc)},
+    ]
+    restored = round_trip(tmp_path, "seating_plans", docs)
+    assert restored == docs
+    assert SeatingPlan(**restored[0]).desk_assignments[0].right_student is None
@@ -0,0 +1,13 @@
+from server import Student, student_document, student_list_query
+
+
+def test_student_document_stores_lowercased_name_for_prefix_search():
+    student = Student(roll_number="23BCS001", name="Aarav Sharma", department="CSE", subjects=["DBMS"])
+    doc = student_document(student)
+    assert doc["name_lower"] == "aarav sharma"
+    assert doc["name"] == "Aarav Sharma"
+
+
+def test_list_query_filters_by_department_only_when_given():
+    assert student_list_query(None) == {}
+    assert student_list_query("CSE") == {"department": "CSE"}